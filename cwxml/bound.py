@@ -1,6 +1,7 @@
 from abc import ABC as AbstractClass, abstractmethod
 from collections import defaultdict
 from mathutils import Vector
+import numpy as np
 from xml.etree import ElementTree as ET
 from .element import (
     AttributeProperty,
@@ -114,16 +115,16 @@ class VerticesProperty(ElementProperty):
     @staticmethod
     def from_xml(element: ET.Element):
         new = VerticesProperty(element.tag, [])
-        text = element.text.strip().split("\n")
-        if len(text) > 0:
-            for line in text:
-                coords = line.strip().split(",")
-                if not len(coords) == 3:
-                    return VerticesProperty.read_value_error(element)
+        text = element.text.strip()
+        num_lines = text.count("\n") + 1
+        if text.count(",") != num_lines * 2:
+            return VerticesProperty.read_value_error(element)
 
-                new.value.append(
-                    Vector((float(coords[0]), float(coords[1]), float(coords[2]))))
+        coords = np.fromstring(text.replace(",", " "), sep=" ", dtype=np.float64)
+        if coords.size != num_lines * 3:
+            return VerticesProperty.read_value_error(element)
 
+        new.value = [Vector(v) for v in coords.reshape((num_lines, 3)).tolist()]
         return new
 
     def to_xml(self):
@@ -175,29 +176,26 @@ class BoundList(ListProperty):
     list_type = BoundChild
     tag_name = "Children"
 
+    BOUND_TYPES = {
+        BoundBox.type: BoundBox,
+        BoundSphere.type: BoundSphere,
+        BoundCapsule.type: BoundCapsule,
+        BoundCylinder.type: BoundCylinder,
+        BoundDisc.type: BoundDisc,
+        BoundCloth.type: BoundCloth,
+        BoundGeometry.type: BoundGeometry,
+        BoundGeometryBVH.type: BoundGeometryBVH,
+    }
+
     @staticmethod
     def from_xml(element: ET.Element):
         new = BoundList()
+        bound_types = BoundList.BOUND_TYPES
 
-        for child in element.iter():
-            if "type" in child.attrib:
-                bound_type = child.get("type")
-                if bound_type == "Box":
-                    new.value.append(BoundBox.from_xml(child))
-                elif bound_type == "Sphere":
-                    new.value.append(BoundSphere.from_xml(child))
-                elif bound_type == "Capsule":
-                    new.value.append(BoundCapsule.from_xml(child))
-                elif bound_type == "Cylinder":
-                    new.value.append(BoundCylinder.from_xml(child))
-                elif bound_type == "Disc":
-                    new.value.append(BoundDisc.from_xml(child))
-                elif bound_type == "Cloth":
-                    new.value.append(BoundCloth.from_xml(child))
-                elif bound_type == "Geometry":
-                    new.value.append(BoundGeometry.from_xml(child))
-                elif bound_type == "GeometryBVH":
-                    new.value.append(BoundGeometryBVH.from_xml(child))
+        for child in element:
+            bound_cls = bound_types.get(child.get("type"), None)
+            if bound_cls is not None:
+                new.value.append(bound_cls.from_xml(child))
 
         return new
 
@@ -230,15 +228,16 @@ class VertexColorProperty(ElementProperty):
     @staticmethod
     def from_xml(element: ET.Element):
         new = VertexColorProperty(element.tag, [])
-        text = element.text.strip().split("\n")
-        if len(text) > 0:
-            for line in text:
-                colors = line.strip().split(",")
-                if len(colors) != 4:
-                    return VertexColorProperty.read_value_error(element)
+        text = element.text.strip()
+        num_lines = text.count("\n") + 1
+        if text.count(",") != num_lines * 3:
+            return VertexColorProperty.read_value_error(element)
 
-                new.value.append((int(colors[0]), int(colors[1]), int(colors[2]), int(colors[3])))
+        colors = np.fromstring(text.replace(",", " "), sep=" ", dtype=np.int64)
+        if colors.size != num_lines * 4:
+            return VertexColorProperty.read_value_error(element)
 
+        new.value = [tuple(c) for c in colors.reshape((num_lines, 4)).tolist()]
         return new
 
     def to_xml(self):
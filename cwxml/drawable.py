@@ -1,5 +1,5 @@
-import io
 import os
+import functools
 from mathutils import Matrix
 import numpy as np
 from numpy.typing import NDArray
@@ -14,13 +14,15 @@ from .element import (
     ColorProperty,
     ElementTree,
     ElementProperty,
+    InternedTextProperty,
     ListProperty,
     QuaternionProperty,
     TextProperty,
     ValueProperty,
     VectorProperty,
     Vector4Property,
-    MatrixProperty
+    MatrixProperty,
+    write_xml_elements
 )
 from .bound import (
     BoundBox,
@@ -67,7 +69,7 @@ class Texture(ElementTree):
 
     def __init__(self):
         super().__init__()
-        self.name = TextProperty("Name", "")
+        self.name = InternedTextProperty("Name", "")
         self.unk32 = ValueProperty("Unk32", 0)
         self.usage = TextProperty("Usage")
         self.usage_flags = FlagsProperty("UsageFlags")
@@ -76,7 +78,7 @@ class Texture(ElementTree):
         self.height = ValueProperty("Height", 0)
         self.miplevels = ValueProperty("MipLevels", 0)
         self.format = TextProperty("Format")
-        self.filename = TextProperty("FileName", "")
+        self.filename = InternedTextProperty("FileName", "")
 
 
 class TextureDictionaryList(ListProperty):
@@ -103,7 +105,7 @@ class TextureShaderParameter(ShaderParameter):
 
     def __init__(self):
         super().__init__()
-        self.texture_name = TextProperty("Name")
+        self.texture_name = InternedTextProperty("Name")
 
     def __hash__(self) -> int:
         return hash((self.name, self.type, self.texture_name))
@@ -159,20 +161,22 @@ class ParametersList(ListProperty):
     list_type = ShaderParameter
     tag_name = "Parameters"
 
+    PARAM_TYPES = {
+        TextureShaderParameter.type: TextureShaderParameter,
+        VectorShaderParameter.type: VectorShaderParameter,
+        ArrayShaderParameter.type: ArrayShaderParameter,
+    }
+
     @staticmethod
     def from_xml(element: ET.Element):
         new = ParametersList()
+        param_types = ParametersList.PARAM_TYPES
 
-        for child in element.iter():
-            if "type" in child.attrib:
-                param_type = child.get("type")
-                if param_type == TextureShaderParameter.type:
-                    new.value.append(TextureShaderParameter.from_xml(child))
-                if param_type == VectorShaderParameter.type:
-                    new.value.append(VectorShaderParameter.from_xml(child))
-                if param_type == ArrayShaderParameter.type:
-                    new.value.append(
-                        ArrayShaderParameter.from_xml(child))
+        # Parameters are a flat list, no need to descend into each parameter's children
+        for child in element:
+            param_cls = param_types.get(child.get("type"))
+            if param_cls is not None:
+                new.value.append(param_cls.from_xml(child))
 
         return new
 
@@ -185,8 +189,8 @@ class Shader(ElementTree):
 
     def __init__(self):
         super().__init__()
-        self.name = TextProperty("Name", "")
-        self.filename = TextProperty("FileName", "")
+        self.name = InternedTextProperty("Name", "")
+        self.filename = InternedTextProperty("FileName", "")
         self.render_bucket = ValueProperty("RenderBucket", 0)
         self.parameters = ParametersList()
 
@@ -247,7 +251,7 @@ class Bone(ElementTree):
     def __init__(self):
         super().__init__()
         # make enum in the future with all of the specific bone names?
-        self.name = TextProperty("Name", "")
+        self.name = InternedTextProperty("Name", "")
         self.tag = ValueProperty("Tag", 0)
         self.index = ValueProperty("Index", 0)
         # by default if a bone don't have parent or sibling there should be -1 instead of 0
@@ -338,7 +342,7 @@ class Light(ElementTree):
         self.intensity = ValueProperty("Intensity")
         self.flags = ValueProperty("Flags")
         self.bone_id = ValueProperty("BoneId")
-        self.type = TextProperty("Type")
+        self.type = InternedTextProperty("Type")
         self.group_id = ValueProperty("GroupId")
         self.time_flags = ValueProperty("TimeFlags")
         self.falloff = ValueProperty("Falloff")
@@ -458,30 +462,39 @@ class VertexBuffer(ElementTree):
 
         return element
 
-    def _load_data_from_str(self, _str: str):
-        layout = self.get_element("layout")
-        struct_dtype = np.dtype([self.VERT_ATTR_DTYPES[attr_name] for attr_name in layout.value])
-        if layout.type == "GTAV2":
+    @staticmethod
+    @functools.cache
+    def _get_layout_dtypes(layout_type: str, attr_names: tuple[str, ...]) -> tuple[np.dtype, tuple[int, ...]]:
+        """Get the structured dtype of a vertex layout and the number of components of each attribute as stored in
+        the XML. Cached, as all geometries share a handful of layouts."""
+        attr_dtypes = [VertexBuffer.VERT_ATTR_DTYPES[attr_name] for attr_name in attr_names]
+        raw_widths = tuple(num_comps for _, _, num_comps in attr_dtypes)
+        if layout_type == "GTAV2":
             # FVF with value GTAV2 (used for cloth) has Normal with format RGBA8 (though A is unused), which CW now
             # exports as 4 floats. Other code assumes that Normal always has 3 floats.
             # This is the only case (given vanilla assets at least) where a vertex element can have a different number
             # of components depending on FVF so just hack it in here. Read the 4 floats and drop the last float.
-            normal_fmt = ("Normal", np.float32, 4)
-            raw_struct_dtype = np.dtype([normal_fmt if attr_name == "Normal" else self.VERT_ATTR_DTYPES[attr_name]
-                                         for attr_name in layout.value])
+            raw_widths = tuple(4 if attr_name == "Normal" else width
+                               for attr_name, width in zip(attr_names, raw_widths))
 
-            raw_data = np.loadtxt(io.StringIO(_str), dtype=raw_struct_dtype)
+        return np.dtype(attr_dtypes), raw_widths
 
-            data = np.empty_like(raw_data, dtype=struct_dtype)
-            for comp in layout.value:
-                if comp == "Normal":
-                    data["Normal"] = raw_data["Normal"][:,:3]
-                else:
-                    data[comp] = raw_data[comp]
+    def _load_data_from_str(self, _str: str):
+        layout = self.get_element("layout")
+        struct_dtype, raw_widths = VertexBuffer._get_layout_dtypes(layout.type, tuple(layout.value))
+
+        # Parse the whole buffer in a single pass. Any whitespace separates values, so the attribute separators and
+        # line breaks don't need special handling. Integer attributes are small enough to be exact as float64.
+        raw_data = np.fromstring(_str, sep=" ", dtype=np.float64).reshape((-1, sum(raw_widths)))
 
-            self.data = data
-        else:
-            self.data = np.loadtxt(io.StringIO(_str), dtype=struct_dtype)
+        data = np.empty(len(raw_data), dtype=struct_dtype)
+        col = 0
+        for attr_name, raw_width in zip(struct_dtype.names, raw_widths):
+            num_comps = struct_dtype[attr_name].shape[0]
+            data[attr_name] = raw_data[:, col:col + num_comps]
+            col += raw_width
+
+        self.data = data
 
     def _data_to_str(self):
         layout = self.get_element("layout")
@@ -558,15 +571,13 @@ class IndexBuffer(ElementTree):
 
         # Get number of rows that can be split into 24 columns
         num_divisble_inds = num_inds - (num_inds % 24)
-        num_rows = int(num_divisble_inds / 24)
+        num_rows = num_divisble_inds // 24
 
-        indices_arr_2d = indices_arr[:num_divisble_inds].reshape(
-            (num_rows, 24))
+        indices_arr_2d = indices_arr[:num_divisble_inds].reshape((num_rows, 24))
 
         index_buffer_str = np_arr_to_str(indices_arr_2d, fmt="%.0u")
         # Add the last row
-        last_row_str = np_arr_to_str(
-            indices_arr[num_divisble_inds:], fmt="%.0u")
+        last_row_str = np_arr_to_str(indices_arr[num_divisble_inds:], fmt="%.0u")
 
         return f"{index_buffer_str}\n{last_row_str}"
 
@@ -610,6 +621,18 @@ class DrawableModelList(ListProperty):
 class Drawable(ElementTree, AbstractClass):
     tag_name = "Drawable"
 
+    BOUND_TYPES = {
+        "Composite": BoundComposite,
+        "Box": BoundBox,
+        "Sphere": BoundSphere,
+        "Capsule": BoundCapsule,
+        "Cylinder": BoundCylinder,
+        "Disc": BoundDisc,
+        "Cloth": BoundCloth,
+        "Geometry": BoundGeometry,
+        "GeometryBVH": BoundGeometryBVH,
+    }
+
     @property
     def is_empty(self) -> bool:
         return len(self.all_models) == 0
@@ -664,28 +687,9 @@ class Drawable(ElementTree, AbstractClass):
         new = super().from_xml(element)
         bounds_elem = element.find("Bounds")
         if bounds_elem is not None:
-            bound_type = bounds_elem.get("type")
-            bound = None
-            if bound_type == "Composite":
-                bound = BoundComposite.from_xml(bounds_elem)
-            elif bound_type == "Box":
-                bound = BoundBox.from_xml(bounds_elem)
-            elif bound_type == "Sphere":
-                bound = BoundSphere.from_xml(bounds_elem)
-            elif bound_type == "Capsule":
-                bound = BoundCapsule.from_xml(bounds_elem)
-            elif bound_type == "Cylinder":
-                bound = BoundCylinder.from_xml(bounds_elem)
-            elif bound_type == "Disc":
-                bound = BoundDisc.from_xml(bounds_elem)
-            elif bound_type == "Cloth":
-                bound = BoundCloth.from_xml(bounds_elem)
-            elif bound_type == "Geometry":
-                bound = BoundGeometry.from_xml(bounds_elem)
-            elif bound_type == "GeometryBVH":
-                bound = BoundGeometryBVH.from_xml(bounds_elem)
-
-            if bound:
+            bound_cls = cls.BOUND_TYPES.get(bounds_elem.get("type"), None)
+            if bound_cls is not None:
+                bound = bound_cls.from_xml(bounds_elem)
                 bound.tag_name = "Bounds"
                 new.bounds = bound
 
@@ -737,6 +741,29 @@ class DrawableDictionary(MutableSequence, Element):
 
         return new
 
+    @classmethod
+    def from_xml_file(cls, filepath):
+        """Read XML from filepath. Drawables are built as soon as their element is fully parsed and then discarded
+        from the tree, so only one drawable element is kept in memory at a time."""
+        new = cls()
+        new.tag_name = "Item"
+
+        root = None
+        depth = 0
+        for event, elem in ET.iterparse(filepath, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1 and elem.tag == new.tag_name:
+                new.append(Drawable.from_xml(elem))
+                root.remove(elem)
+
+        return new
+
     def to_xml(self):
         element = ET.Element(self.tag_name)
         for drawable in self._value:
@@ -749,6 +776,21 @@ class DrawableDictionary(MutableSequence, Element):
 
         return element
 
+    def write_xml(self, filepath):
+        """Write object as XML to filepath. Each drawable is converted and written on its own, so only one drawable
+        element tree is kept in memory at a time."""
+        for drawable in self._value:
+            if not isinstance(drawable, Drawable):
+                raise TypeError(
+                    f"{type(self).__name__}s can only hold '{Drawable.__name__}' objects, not '{type(drawable)}'!")
+
+        def drawable_elements():
+            for drawable in self._value:
+                drawable.tag_name = "Item"
+                yield drawable.to_xml()
+
+        write_xml_elements(filepath, self.tag_name, drawable_elements())
+
 
 class DrawableMatrices(ElementProperty):
     value_types = (list)
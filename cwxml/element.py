@@ -1,9 +1,15 @@
 """Manages reading/writing Codewalker XML files"""
+import os
+import re
+import sys
+import math
+import functools
 from mathutils import Vector, Quaternion, Matrix
 from abc import abstractmethod, ABC as AbstractClass, abstractclassmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Optional
 from xml.etree import ElementTree as ET
+import numpy as np
 from numpy import float32
 
 
@@ -25,11 +31,62 @@ def indent(elem: ET.Element, level=0):
             elem.tail = i
 
         # Indent innertext of elements on new lines. Used in cases like <VerticesProperty />
-        if elem.text and len(elem.text.strip()) > 0 and elem.text.find("\n") != -1:
-            lines = elem.text.strip().split("\n")
-            for index, line in enumerate(lines):
-                lines[index] = ((level + 1) * amount) + line
-            elem.text = "\n" + "\n".join(lines) + i
+        # Done with a single str.replace, these texts can be several MB (e.g. vertex buffers)
+        if elem.text and "\n" in elem.text:
+            text = elem.text.strip()
+            if text:
+                line_indent = (level + 1) * amount
+                elem.text = "\n" + line_indent + text.replace("\n", "\n" + line_indent) + i
+
+
+def write_xml_elements(filepath: str, tag_name: str, elements: Iterable[ET.Element]):
+    """Write ``elements`` as children of a ``tag_name`` root element to filepath. Same output as
+    ``Element.write_xml``, but each element is indented and serialized as soon as it is produced, so only one
+    of them has to be kept in memory at a time.
+
+    The elements are written to a temporary file that replaces filepath once all of them were written. If producing
+    an element raises, the previous contents of filepath are left untouched."""
+    tmp_filepath = f"{filepath}.tmp"
+    try:
+        with open(tmp_filepath, "w", encoding="UTF-8") as f:
+            f.write("<?xml version='1.0' encoding='UTF-8'?>\n")
+
+            is_empty = True
+            for element in elements:
+                if is_empty:
+                    f.write(f"<{tag_name}>")
+                    is_empty = False
+
+                indent(element, level=1)
+                element.tail = None
+                f.write("\n  ")
+                f.write(ET.tostring(element, encoding="unicode"))
+
+            if is_empty:
+                f.write(f"<{tag_name} />")
+            else:
+                f.write(f"\n</{tag_name}>\n")
+
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
+
+
+@functools.lru_cache(maxsize=8192)
+def _float32_to_str(value: float) -> str:
+    return str(float32(value))
+
+
+def float32_to_str(value: float) -> str:
+    """Format ``value`` as a 32-bit float. Results are cached, the same values (0, 1, identity matrices...) are
+    written over and over and creating numpy scalars is comparatively slow."""
+    if value == 0.0:
+        # 0.0 and -0.0 are equal keys in the cache but are written differently
+        return "-0.0" if math.copysign(1.0, value) < 0.0 else "0.0"
+
+    return _float32_to_str(value)
 
 
 def get_str_type(value: str):
@@ -53,8 +110,25 @@ def get_str_type(value: str):
     return value
 
 
+def parse_matrix_rows(text: str) -> list[list[float]]:
+    """Parse the rows of a matrix written as text. Rows are separated by line breaks or by runs of three spaces, like
+    ``"1 0 0   0 1 0   0 0 1"``. All the values are parsed in a single pass."""
+    rows = [row for row in re.split(r"\n|   ", text) if row.strip()]
+    if not rows:
+        return []
+
+    values = np.fromstring(text, sep=" ", dtype=np.float64)
+    if len(values) % len(rows) != 0:
+        # Rows have different lengths, parse each of them on its own
+        return [np.fromstring(row, sep=" ", dtype=np.float64).tolist() for row in rows]
+
+    return values.reshape((len(rows), -1)).tolist()
+
+
 class Element(AbstractClass):
     """Abstract XML element to base all other XML elements off of"""
+    __slots__ = ()
+
     @property
     @abstractmethod
     def tag_name(self):
@@ -93,24 +167,87 @@ class Element(AbstractClass):
 class ElementTree(Element):
     """XML element that contains children defined by it's properties"""
 
+    @classmethod
+    def get_xml_schema(cls, instance: "ElementTree") -> tuple[tuple[tuple[str, type, str], ...], tuple[tuple[str, str], ...], Optional[tuple[tuple[str, Optional[type], str], ...]]]:
+        """Get the child elements ``(prop_name, element_type, tag_name)`` and attributes ``(prop_name, attr_name)``
+        defined by the class. The third item lists all of them, in the order set by ``__init__``, if those are the
+        only attributes ``__init__`` sets (``element_type`` is None for attributes), otherwise it is None.
+
+        The schema is the same for every instance created by ``cls()``, so it is built from the first instance and
+        cached on the class."""
+        schema = cls.__dict__.get("_xml_schema", None)
+        if schema is None:
+            element_props = []
+            attribute_props = []
+            ordered_props = []
+            instance_vars = vars(instance)
+            for prop_name, obj_element in instance_vars.items():
+                if isinstance(obj_element, Element):
+                    element_props.append((prop_name, type(obj_element), obj_element.tag_name))
+                    ordered_props.append(element_props[-1])
+                elif isinstance(obj_element, AttributeProperty):
+                    attribute_props.append((prop_name, obj_element.name))
+                    ordered_props.append((prop_name, None, obj_element.name))
+
+            only_xml_props = len(ordered_props) == len(instance_vars)
+            schema = (tuple(element_props), tuple(attribute_props), tuple(ordered_props) if only_xml_props else None)
+            cls._xml_schema = schema
+
+        return schema
+
     @classmethod
     def from_xml(cls: Element, element: ET.Element):
         """Convert ET.Element object to ElementTree"""
+        children = {}
+        for child in element:
+            children.setdefault(child.tag, child)
+
+        schema = cls.__dict__.get("_xml_schema", None)
+        if schema is not None and cls._has_all_xml_props(schema, element, children):
+            # Every property is going to be replaced by the one read from the XML, so skip ``__init__`` instead of
+            # creating default properties just to throw them away. CW writes every field of most items (e.g. lights).
+            new = cls.__new__(cls)
+            props = vars(new)
+            for prop_name, element_type, name in schema[2]:
+                if element_type is None:
+                    props[prop_name] = AttributeProperty(name, element.get(name))
+                else:
+                    props[prop_name] = element_type.from_xml(children[name])
+
+            return new
+
         new = cls()
+        element_props, attribute_props, _ = cls.get_xml_schema(new)
+
+        for prop_name, element_type, tag_name in element_props:
+            child = children.get(tag_name, None)
+            if child is not None:
+                # Add element to object if tag is defined in class definition
+                setattr(new, prop_name, element_type.from_xml(child))
 
-        for prop_name, obj_element in vars(new).items():
-            if isinstance(obj_element, Element):
-                child = element.find(obj_element.tag_name)
-                if child is not None and obj_element.tag_name == child.tag:
-                    # Add element to object if tag is defined in class definition
-                    setattr(new, prop_name, type(obj_element).from_xml(child))
-            elif isinstance(obj_element, AttributeProperty):
+        if attribute_props and new.tag_name == element.tag:
+            props = vars(new)
+            for prop_name, attr_name in attribute_props:
                 # Add attribute to element if attribute is defined in class definition
-                if obj_element.name in element.attrib and new.tag_name == element.tag:
-                    obj_element.value = element.get(obj_element.name)
+                if attr_name in element.attrib:
+                    props[prop_name].value = element.get(attr_name)
 
         return new
 
+    @classmethod
+    def _has_all_xml_props(cls, schema, element: ET.Element, children: dict[str, ET.Element]) -> bool:
+        """Check if the XML element provides every property of the schema."""
+        element_props, attribute_props, ordered_props = schema
+        if ordered_props is None:
+            # ``__init__`` sets other attributes too, it must run
+            return False
+
+        if attribute_props and (cls.tag_name != element.tag or
+                                any(attr_name not in element.attrib for _, attr_name in attribute_props)):
+            return False
+
+        return all(tag_name in children for _, _, tag_name in element_props)
+
     def to_xml(self):
         """Convert ElementTree to ET.Element object"""
         root = ET.Element(self.tag_name)
@@ -155,7 +292,7 @@ class ElementTree(Element):
             return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeProperty:
     name: str
     _value: Any = None
@@ -170,6 +307,10 @@ class AttributeProperty:
 
 
 class ElementProperty(Element, AbstractClass):
+    # Subclasses that are instantiated for every field of every item (values, text, vectors...) declare
+    # ``__slots__ = ("tag_name", "value")`` so their instances don't need a ``__dict__``
+    __slots__ = ()
+
     @property
     @abstractmethod
     def value_types(self):
@@ -207,11 +348,14 @@ class ListProperty(ElementProperty, AbstractClass):
     @classmethod
     def from_xml(cls, element: ET.Element):
         new = cls(element.tag)
-
-        children = element.findall(new.list_type.tag_name)
-
-        for child in children:
-            new.value.append(new.list_type.from_xml(child))
+        list_type = new.list_type
+        item_tag = list_type.tag_name
+
+        # Plain tag comparison on the direct children, findall() would go through the ElementPath machinery for
+        # every list
+        for child in element:
+            if child.tag == item_tag:
+                new.value.append(list_type.from_xml(child))
         return new
 
     def to_xml(self):
@@ -259,6 +403,7 @@ class ListPropertyRequired(ListProperty):
 
 
 class TextProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (str)
 
     def __init__(self, tag_name: str = "Name", value=None):
@@ -277,8 +422,19 @@ class TextProperty(ElementProperty):
         return result
 
 
+class InternedTextProperty(TextProperty):
+    """Same as TextProperty but the text is interned. Used for names repeated many times in a file (shader names,
+    texture names, bone names...) so all the occurrences share the same string object"""
+    __slots__ = ()
+
+    @staticmethod
+    def from_xml(element: ET.Element):
+        return InternedTextProperty(element.tag, sys.intern(element.text) if element.text else None)
+
+
 class TextPropertyRequired(ElementProperty):
     """Same as TextProperty but returns an empty element rather then None in case the passed element's value is empty or None"""
+    __slots__ = ("tag_name", "value")
     value_types = (str)
 
     def __init__(self, tag_name: str = "Name", value=None):
@@ -297,6 +453,7 @@ class TextPropertyRequired(ElementProperty):
 
 
 class ColorProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (list)
 
     def __init__(self, tag_name: str, value=None):
@@ -314,6 +471,7 @@ class ColorProperty(ElementProperty):
 
 
 class Vector2Property(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (Vector)
 
     def __init__(self, tag_name: str, value=None):
@@ -327,12 +485,13 @@ class Vector2Property(ElementProperty):
         return Vector2Property(element.tag, Vector((float(element.get("x", default=0)), float(element.get("y", default=0)))))
 
     def to_xml(self):
-        x = str(float32(self.value.x))
-        y = str(float32(self.value.y))
+        x = float32_to_str(self.value.x)
+        y = float32_to_str(self.value.y)
         return ET.Element(self.tag_name, attrib={"x": x, "y": y})
 
 
 class VectorProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (Vector)
 
     def __init__(self, tag_name: str, value=None):
@@ -343,13 +502,14 @@ class VectorProperty(ElementProperty):
         return VectorProperty(element.tag, Vector((float(element.get("x", default=0)), float(element.get("y", default=0)), float(element.get("z", default=0)))))
 
     def to_xml(self):
-        x = str(float32(self.value.x))
-        y = str(float32(self.value.y))
-        z = str(float32(self.value.z))
+        x = float32_to_str(self.value.x)
+        y = float32_to_str(self.value.y)
+        z = float32_to_str(self.value.z)
         return ET.Element(self.tag_name, attrib={"x": x, "y": y, "z": z})
 
 
 class Vector4Property(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (Vector)
 
     def __init__(self, tag_name: str, value=None):
@@ -360,14 +520,15 @@ class Vector4Property(ElementProperty):
         return Vector4Property(element.tag, Vector((float(element.get("x", default=0)), float(element.get("y", default=0)), float(element.get("z", default=0)), float(element.get("w", default=0)))))
 
     def to_xml(self):
-        x = str(float32(self.value.x))
-        y = str(float32(self.value.y))
-        z = str(float32(self.value.z))
-        w = str(float32(self.value.w))
+        x = float32_to_str(self.value.x)
+        y = float32_to_str(self.value.y)
+        z = float32_to_str(self.value.z)
+        w = float32_to_str(self.value.w)
         return ET.Element(self.tag_name, attrib={"x": x, "y": y, "z": z, "w": w})
 
 
 class QuaternionProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (Quaternion)
 
     def __init__(self, tag_name: str, value=None):
@@ -381,14 +542,15 @@ class QuaternionProperty(ElementProperty):
         return QuaternionProperty(element.tag, Quaternion((float(element.get("w")), float(element.get("x")), float(element.get("y")), float(element.get("z")))))
 
     def to_xml(self):
-        x = str(float32(self.value.x))
-        y = str(float32(self.value.y))
-        z = str(float32(self.value.z))
-        w = str(float32(self.value.w))
+        x = float32_to_str(self.value.x)
+        y = float32_to_str(self.value.y)
+        z = float32_to_str(self.value.z)
+        w = float32_to_str(self.value.w)
         return ET.Element(self.tag_name, attrib={"x": x, "y": y, "z": z, "w": w})
 
 
 class MatrixProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (Matrix)
 
     def __init__(self, tag_name: str, value=None):
@@ -396,16 +558,9 @@ class MatrixProperty(ElementProperty):
 
     @staticmethod
     def from_xml(element: ET.Element):
-        s_mtx = element.text.strip().replace("\n", "").split("   ")
-        s_mtx = [s for s in s_mtx if s]  # removes empty strings
         m = Matrix()
-        r_idx = 0
-        for item in s_mtx:
-            v_idx = 0
-            for value in item.strip().split(" "):
-                m[r_idx][v_idx] = float(value)
-                v_idx += 1
-            r_idx += 1
+        for r_idx, row in enumerate(parse_matrix_rows(element.text)):
+            m[r_idx][:len(row)] = row
         return MatrixProperty(element.tag, m)
 
     def to_xml(self):
@@ -423,6 +578,7 @@ class MatrixProperty(ElementProperty):
 
 
 class Matrix33Property(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (Matrix)
 
     def __init__(self, tag_name: str, value=None):
@@ -430,16 +586,9 @@ class Matrix33Property(ElementProperty):
 
     @staticmethod
     def from_xml(element: ET.Element):
-        s_mtx = element.text.strip().replace("\n", "").split("   ")
-        s_mtx = [s for s in s_mtx if s]  # removes empty strings
         m = Matrix.Diagonal((0, 0, 0))
-        r_idx = 0
-        for item in s_mtx:
-            v_idx = 0
-            for value in item.strip().split(" "):
-                m[r_idx][v_idx] = float(value)
-                v_idx += 1
-            r_idx += 1
+        for r_idx, row in enumerate(parse_matrix_rows(element.text)):
+            m[r_idx][:len(row)] = row
         return MatrixProperty(element.tag, m)
 
     def to_xml(self):
@@ -457,6 +606,7 @@ class Matrix33Property(ElementProperty):
 
 
 class FlagsProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (list)
 
     def __init__(self, tag_name: str = "Flags", value=None):
@@ -491,6 +641,7 @@ class FlagsProperty(ElementProperty):
 
 
 class ValueProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (int, str, bool, float)
 
     def __init__(self, tag_name: str, value=0):
@@ -506,7 +657,7 @@ class ValueProperty(ElementProperty):
     def to_xml(self):
         value = self.value
         if isinstance(value, float):
-            value = int(self.value) if self.value.is_integer() else float32(self.value)
+            value = int(self.value) if self.value.is_integer() else float32_to_str(self.value)
         elif isinstance(value, bool):
             # CW expects lowercase bools in PSO/meta XMLs
             value = str(value).lower()
@@ -514,6 +665,7 @@ class ValueProperty(ElementProperty):
 
 
 class StringValueProperty(ElementProperty):
+    __slots__ = ("tag_name", "value")
     value_types = (str)
 
     def __init__(self, tag_name: str, value=""):
@@ -532,6 +684,7 @@ class StringValueProperty(ElementProperty):
 
 class TextListProperty(ElementProperty):
     """Separates each word of an element's text into a list"""
+    __slots__ = ("tag_name", "value")
     value_types = (list)
 
     def __init__(self, tag_name, value=None):
@@ -3,6 +3,7 @@ from mathutils import Matrix
 from xml.etree import ElementTree as ET
 from .element import (
     AttributeProperty,
+    Element,
     ElementTree,
     ElementProperty,
     ListProperty,
@@ -11,9 +12,10 @@ from .element import (
     Vector4Property,
     TextProperty,
     ValueProperty,
-    VectorProperty
+    VectorProperty,
+    write_xml_elements
 )
-from .drawable import Drawable, Lights, VertexLayoutList
+from .drawable import Drawable, Joints, Lights, Skeleton, VertexLayoutList
 from .bound import BoundComposite
 
 
@@ -25,6 +27,40 @@ class YFT:
     def from_xml_file(filepath):
         return Fragment.from_xml_file(filepath)
 
+    @staticmethod
+    def skeleton_from_xml_file(filepath):
+        """Read only the skeleton and joints of the fragment drawable at ``filepath``. The file is streamed and
+        parsing stops once both are read, so the models and physics of the fragment are never parsed."""
+        fragment = Fragment()
+        drawable = fragment.drawable
+        found_skeleton = found_joints = False
+
+        path = []
+        for event, elem in ET.iterparse(filepath, events=("start", "end")):
+            if event == "start":
+                path.append(elem.tag)
+                continue
+
+            if len(path) == 3 and path[1] == Drawable.tag_name:
+                if elem.tag == Skeleton.tag_name:
+                    drawable.skeleton = Skeleton.from_xml(elem)
+                    found_skeleton = True
+                elif elem.tag == Joints.tag_name:
+                    drawable.joints = Joints.from_xml(elem)
+                    found_joints = True
+
+                if found_skeleton and found_joints:
+                    break
+
+                # Release each drawable child once read, only the skeleton and joints are kept
+                elem.clear()
+            elif len(path) == 2 and elem.tag == Drawable.tag_name:
+                break
+
+            path.pop()
+
+        return fragment
+
     @staticmethod
     def write_xml(fragment, filepath):
         return fragment.write_xml(filepath)
@@ -286,3 +322,16 @@ class Fragment(ElementTree, AbstractClass):
 
     def get_lods_by_id(self):
         return {1: self.physics.lod1, 2: self.physics.lod2, 3: self.physics.lod3}
+
+    def write_xml(self, filepath):
+        """Write object as XML to filepath. Each child element is converted and written on its own, so the element
+        trees of the drawable and the physics (with all its children drawables) are not in memory at the same time.
+        If converting any of them fails, the existing file at filepath is kept."""
+        def child_elements():
+            for child in vars(self).values():
+                if isinstance(child, Element):
+                    element = child.to_xml()
+                    if element is not None:
+                        yield element
+
+        write_xml_elements(filepath, self.tag_name, child_elements())
@@ -127,30 +127,31 @@ class ShaderParameterDefsList(ListProperty):
     list_type = ShaderParameterDef
     tag_name = "Parameters"
 
+    PARAM_TYPES = {
+        param_cls.type.value: param_cls for param_cls in (
+            ShaderParameterTextureDef,
+            ShaderParameterFloatDef,
+            ShaderParameterFloat2Def,
+            ShaderParameterFloat3Def,
+            ShaderParameterFloat4Def,
+            ShaderParameterFloat4x4Def,
+        )
+    }
+
     @staticmethod
     def from_xml(element: ET.Element):
         new = ShaderParameterDefsList()
+        param_types = ShaderParameterDefsList.PARAM_TYPES
+
+        for child in element:
+            param_type = child.get("type")
+            if param_type is None:
+                continue
+
+            param_cls = param_types.get(param_type, None)
+            assert param_cls is not None, f"Unknown shader parameter type '{param_type}'"
 
-        for child in element.iter():
-            if "type" in child.attrib:
-                param_type = child.get("type")
-                match param_type:
-                    case ShaderParameterType.TEXTURE:
-                        param = ShaderParameterTextureDef.from_xml(child)
-                    case ShaderParameterType.FLOAT:
-                        param = ShaderParameterFloatDef.from_xml(child)
-                    case ShaderParameterType.FLOAT2:
-                        param = ShaderParameterFloat2Def.from_xml(child)
-                    case ShaderParameterType.FLOAT3:
-                        param = ShaderParameterFloat3Def.from_xml(child)
-                    case ShaderParameterType.FLOAT4:
-                        param = ShaderParameterFloat4Def.from_xml(child)
-                    case ShaderParameterType.FLOAT4X4:
-                        param = ShaderParameterFloat4x4Def.from_xml(child)
-                    case _:
-                        assert False, f"Unknown shader parameter type '{param_type}'"
-
-                new.value.append(param)
+            new.value.append(param_cls.from_xml(child))
 
         return new
 
@@ -345,54 +345,45 @@ class ExtensionsList(ListProperty):
     list_type = Extension
     tag_name = "extensions"
 
+    EXTENSION_TYPES = {
+        ext_cls.type: ext_cls for ext_cls in (
+            ExtensionLightEffect,
+            ExtensionParticleEffect,
+            ExtensionAudioCollision,
+            ExtensionAudioEmitter,
+            ExtensionExplosionEffect,
+            ExtensionLadder,
+            ExtensionBuoyancy,
+            ExtensionExpression,
+            ExtensionLightShaft,
+            ExtensionDoor,
+            ExtensionSpawnPoint,
+            ExtensionSpawnPointOverride,
+            ExtensionWindDisturbance,
+            ExtensionProcObject,
+        )
+    }
+
     @staticmethod
     def get_extension_xml_class_from_type(ext_type: str) -> Union[Type[Extension], None]:
-        if ext_type == ExtensionLightEffect.type:
-            return ExtensionLightEffect
-        elif ext_type == ExtensionParticleEffect.type:
-            return ExtensionParticleEffect
-        elif ext_type == ExtensionAudioCollision.type:
-            return ExtensionAudioCollision
-        elif ext_type == ExtensionAudioEmitter.type:
-            return ExtensionAudioEmitter
-        elif ext_type == ExtensionExplosionEffect.type:
-            return ExtensionExplosionEffect
-        elif ext_type == ExtensionLadder.type:
-            return ExtensionLadder
-        elif ext_type == ExtensionBuoyancy.type:
-            return ExtensionBuoyancy
-        elif ext_type == ExtensionExpression.type:
-            return ExtensionExpression
-        elif ext_type == ExtensionLightShaft.type:
-            return ExtensionLightShaft
-        elif ext_type == ExtensionDoor.type:
-            return ExtensionDoor
-        elif ext_type == ExtensionSpawnPoint.type:
-            return ExtensionSpawnPoint
-        elif ext_type == ExtensionSpawnPointOverride.type:
-            return ExtensionSpawnPointOverride
-        elif ext_type == ExtensionWindDisturbance.type:
-            return ExtensionWindDisturbance
-        elif ext_type == ExtensionProcObject.type:
-            return ExtensionProcObject
-
-        return None
+        return ExtensionsList.EXTENSION_TYPES.get(ext_type, None)
 
     @staticmethod
     def from_xml(element: ET.Element):
         new = ExtensionsList()
 
-        for child in element.iter():
-            if "type" in child.attrib:
-                ext_type = child.get("type")
-                ext_class = ExtensionsList.get_extension_xml_class_from_type(
-                    ext_type)
+        for child in element:
+            ext_type = child.get("type")
+            if ext_type is None:
+                continue
+
+            ext_class = ExtensionsList.get_extension_xml_class_from_type(ext_type)
 
-                if ext_class is None:
-                    print(f"Unknown extension type '{ext_type}'! Skipping...")
-                    continue
+            if ext_class is None:
+                print(f"Unknown extension type '{ext_type}'! Skipping...")
+                continue
 
-                new.value.append(ext_class.from_xml(child))
+            new.value.append(ext_class.from_xml(child))
 
         return new
 
@@ -7,10 +7,10 @@ from .element import (
     QuaternionProperty,
     TextProperty,
     ValueProperty,
-    VectorProperty
+    VectorProperty,
+    float32_to_str
 )
 from .ymap import EntityList, ExtensionsList
-from numpy import float32
 
 
 class YTYP:
@@ -77,7 +77,7 @@ class Corner(ElementProperty):
             return None
 
         elem = ET.Element(self.tag_name)
-        elem.text = ",".join([str(float32(val)) for val in self.value])
+        elem.text = ",".join([float32_to_str(val) for val in self.value])
         return elem
 
 
@@ -258,19 +258,21 @@ class ArchetypesList(ListProperty):
     list_type = BaseArchetype
     tag_name = "archetypes"
 
+    ARCHETYPE_TYPES = {
+        "CBaseArchetypeDef": BaseArchetype,
+        "CMloArchetypeDef": MloArchetype,
+        "CTimeArchetypeDef": TimeArchetype,
+    }
+
     @staticmethod
     def from_xml(element: ET.Element):
         new = ArchetypesList()
+        archetype_types = ArchetypesList.ARCHETYPE_TYPES
 
-        for child in element.iter():
-            if "type" in child.attrib:
-                arch_type = child.get("type")
-                if arch_type == "CBaseArchetypeDef":
-                    new.value.append(BaseArchetype.from_xml(child))
-                elif arch_type == "CMloArchetypeDef":
-                    new.value.append(MloArchetype.from_xml(child))
-                elif arch_type == "CTimeArchetypeDef":
-                    new.value.append(TimeArchetype.from_xml(child))
+        for child in element:
+            archetype_cls = archetype_types.get(child.get("type"), None)
+            if archetype_cls is not None:
+                new.value.append(archetype_cls.from_xml(child))
 
         return new
 
@@ -2,8 +2,10 @@
 Various functions related to geometry math.
 """
 import numpy as np
-from mathutils import Vector
-from typing import NamedTuple
+from numpy.typing import NDArray
+from mathutils import Vector, geometry
+from typing import NamedTuple, Union
+from . import miniball
 
 
 class Centroid(NamedTuple):
@@ -150,8 +152,6 @@ def get_mass_properties_of_box(box_min: Vector, box_max: Vector) -> MassProperti
 
 
 def get_centroid_of_mesh(mesh_vertices) -> Centroid:
-    from . import miniball
-
     while True:
         try:  # ugly, miniball can sometimes fail, so try again...
             C, r2 = miniball.get_bounding_ball(mesh_vertices)
@@ -269,24 +269,23 @@ def is_mesh_solid(mesh_vertices, mesh_faces) -> bool:
 
 def calculate_composite_inertia(
     root_cg: Vector,
-    parts_cg: list[Vector],
-    parts_mass: list[float],
-    parts_inertia: list[Vector]
+    parts_cg: Union[list[Vector], NDArray],
+    parts_mass: Union[list[float], NDArray],
+    parts_inertia: Union[list[Vector], NDArray]
 ) -> Vector:
+    """Sum the inertias of all parts around ``root_cg`` (parallel axis theorem). The parts can be given as
+    sequences of vectors or as (N, 3) arrays."""
+    parts_cg = np.asarray(parts_cg, dtype=np.float64).reshape((-1, 3))
+    parts_mass = np.asarray(parts_mass, dtype=np.float64)
+    parts_inertia = np.asarray(parts_inertia, dtype=np.float64).reshape((-1, 3))
+
     assert len(parts_cg) == len(parts_mass)
     assert len(parts_cg) == len(parts_inertia)
 
-    total_inertia = Vector((0.0, 0.0, 0.0))
-    for cg, mass, inertia in zip(parts_cg, parts_mass, parts_inertia):
-        x, y, z = cg - root_cg
-        x2, y2, z2 = x * x, y * y, z * z
-        inertia.x += mass * (y2 + z2)
-        inertia.y += mass * (z2 + x2)
-        inertia.z += mass * (x2 + y2)
-
-        total_inertia += inertia
+    x2, y2, z2 = np.square(parts_cg - np.asarray(root_cg, dtype=np.float64)).T
+    parallel_axis_inertia = np.column_stack((y2 + z2, z2 + x2, x2 + y2)) * parts_mass[:, np.newaxis]
 
-    return total_inertia
+    return Vector((parts_inertia + parallel_axis_inertia).sum(axis=0))
 
 NO_NEIGHBOR = -1
 
@@ -332,7 +331,6 @@ def _try_shrink_mesh(mesh_vertices, mesh_faces, neighbors, margin: float):
         max_distance = segment_length
 
         def _intersect_test(v1, v2, v3):
-            from mathutils import geometry
             intersect_pos = geometry.intersect_ray_tri(v1, v2, v3, segment_dir, segment_pos)
             if intersect_pos is None:
                 return False
@@ -360,7 +358,6 @@ def _try_shrink_mesh(mesh_vertices, mesh_faces, neighbors, margin: float):
 
 def _shrink_polys(mesh_vertices, mesh_faces, neighbors, margin):
     # TODO: copied from rageAm's C++ code, very unoptimized Python code, vectorize with Numpy somehow
-    from mathutils import geometry
 
     output_vertices = np.empty_like(mesh_vertices)
     processed_verts = set()
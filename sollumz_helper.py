@@ -1,7 +1,7 @@
 import bpy
 import traceback
 import time
-from typing import Optional
+from typing import Iterable, Optional
 from abc import abstractmethod
 from mathutils import Matrix
 
@@ -99,41 +99,40 @@ def has_collision(obj):
 
 def duplicate_object_with_children(obj):
     objs = get_object_with_children(obj)
-    new_objs = []
+    new_obj_by_obj = {}
     for o in objs:
         new_obj = o.copy()
         new_obj.animation_data_clear()
-        new_objs.append(new_obj)
-    for i in range(len(objs)):
-        if objs[i].parent:
-            new_objs[i].parent = new_objs[objs.index(objs[i].parent)]
-    for new_obj in new_objs:
-        bpy.context.scene.collection.objects.link(new_obj)
+        new_obj_by_obj[o] = new_obj
+    # The root keeps its parent, all other objects are parented within the hierarchy
+    for o in objs[1:]:
+        new_obj_by_obj[o].parent = new_obj_by_obj[o.parent]
+    scene_objects = bpy.context.scene.collection.objects
+    for new_obj in new_obj_by_obj.values():
+        scene_objects.link(new_obj)
         for constraint in new_obj.constraints:
-            if hasattr(constraint, "target") and constraint.target in objs:
-                constraint.target = new_objs[objs.index(constraint.target)]
-    return new_objs[0]
+            if hasattr(constraint, "target") and constraint.target in new_obj_by_obj:
+                constraint.target = new_obj_by_obj[constraint.target]
+    return new_obj_by_obj[obj]
 
 
-def find_sollumz_parent(obj: bpy.types.Object, parent_type: Optional[SollumType] = None) -> bpy.types.Object | None:
-    """Find parent Fragment or Drawable if one exists. Returns None otherwise."""
-    parent_types = [SollumType.FRAGMENT, SollumType.DRAWABLE, SollumType.DRAWABLE_DICTIONARY,
-                    SollumType.CLIP_DICTIONARY, SollumType.YMAP, *BOUND_TYPES]
+SOLLUMZ_PARENT_TYPES = frozenset((SollumType.FRAGMENT, SollumType.DRAWABLE, SollumType.DRAWABLE_DICTIONARY,
+                                   SollumType.CLIP_DICTIONARY, SollumType.YMAP, *BOUND_TYPES))
 
-    if parent_type is not None and obj.parent is not None and obj.parent.sollum_type == parent_type:
-        return obj.parent
 
-    if obj.parent is None and obj.sollum_type in parent_types:
-        return obj
+def find_sollumz_parent(obj: bpy.types.Object, parent_type: Optional[SollumType] = None) -> bpy.types.Object | None:
+    """Find parent Fragment or Drawable if one exists. Returns None otherwise."""
+    while obj.parent is not None:
+        if parent_type is not None and obj.parent.sollum_type == parent_type:
+            return obj.parent
 
-    if obj.parent is None:
-        return None
+        obj = obj.parent
 
-    return find_sollumz_parent(obj.parent, parent_type)
+    return obj if obj.sollum_type in SOLLUMZ_PARENT_TYPES else None
 
 
-def get_sollumz_materials(obj: bpy.types.Object):
-    """Get all Sollumz materials used by ``drawable_obj``."""
+def get_sollumz_materials(obj: bpy.types.Object, lod_levels: Iterable[LODLevel] = LODLevel):
+    """Get all Sollumz materials used by ``drawable_obj``. Only meshes of ``lod_levels`` are considered."""
     materials: list[bpy.types.Material] = []
     used_materials: dict[bpy.types.Material, bool] = {}
 
@@ -142,7 +141,7 @@ def get_sollumz_materials(obj: bpy.types.Object):
             continue
 
         lods = child.sz_lods
-        for lod_level in LODLevel:
+        for lod_level in lod_levels:
             lod = lods.get_lod(lod_level)
             lod_mesh = lod.mesh
             if lod_mesh is None:
@@ -172,9 +171,11 @@ def get_export_transforms_to_apply(obj: bpy.types.Object):
 
 def get_parent_inverse(obj: bpy.types.Object) -> Matrix:
     """Get the parent transforms to unapply based on the "Apply Parent Transforms" option"""
-    parent_obj = find_sollumz_parent(obj)
+    if obj.matrix_world.is_identity:
+        return Matrix()
 
-    if obj.matrix_world.is_identity or parent_obj is None:
+    parent_obj = find_sollumz_parent(obj)
+    if parent_obj is None:
         return Matrix()
 
     if get_export_settings().apply_transforms:
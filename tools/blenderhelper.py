@@ -1,4 +1,5 @@
 import re
+import functools
 import bpy
 import bmesh
 from mathutils import Matrix, Vector
@@ -13,9 +14,13 @@ def get_all_collections():
     return [bpy.context.scene.collection, *bpy.data.collections]
 
 
+NUMBER_SUFFIX_RE = re.compile(r"\.[0-9]")
+
+
+@functools.lru_cache(maxsize=1024)
 def remove_number_suffix(string: str):
     """Remove the .00# at that Blender puts at the end of object names."""
-    match = re.search("\.[0-9]", string)
+    match = NUMBER_SUFFIX_RE.search(string)
 
     if match is None:
         return string
@@ -266,18 +271,18 @@ def get_armature_obj(armature):
 
 
 def get_children_recursive(obj) -> list[bpy.types.Object]:
+    """Get all descendants of ``obj`` in depth-first order. Iterative, and ``Object.children`` (which scans all
+    objects in the file) is only accessed once per object."""
     children = []
 
     if obj is None:
         return children
 
-    if len(obj.children) < 1:
-        return children
-
-    for child in obj.children:
+    stack = list(reversed(obj.children))
+    while stack:
+        child = stack.pop()
         children.append(child)
-        if len(child.children) > 0:
-            children.extend(get_children_recursive(child))
+        stack.extend(reversed(child.children))
 
     return children
 
@@ -414,6 +419,11 @@ def get_evaluated_obj(obj: bpy.types.Object) -> bpy.types.Object:
     return obj_eval
 
 
+def obj_mesh_needs_evaluation(obj: bpy.types.Object) -> bool:
+    """Whether the evaluated mesh of ``obj`` can differ from ``obj.data``, i.e. it has modifiers or shape keys."""
+    return len(obj.modifiers) > 0 or obj.data.shape_keys is not None
+
+
 def parent_objs(objs: list[bpy.types.Object], parent_obj: bpy.types.Object):
     for obj in objs:
         obj.parent = parent_obj
@@ -12,6 +12,27 @@ from .blenderhelper import get_children_recursive
 from ..cwxml.shader import ShaderManager
 
 
+def create_triangle_mesh_geometry(mesh: bpy.types.Mesh, vertices: NDArray, triangles: NDArray):
+    """Fill the mesh vertices and triangles directly from numpy buffers of shapes (N, 3). Much faster than
+    ``Mesh.from_pydata``, which goes through every element in Python."""
+    num_verts = len(vertices)
+    num_tris = len(triangles)
+
+    if num_tris > 0 and triangles.max() >= num_verts:
+        raise ValueError(f"Indices array references vertex {triangles.max()} but there are only {num_verts} vertices!")
+
+    mesh.vertices.add(num_verts)
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(vertices, dtype=np.float32).ravel())
+
+    mesh.loops.add(triangles.size)
+    mesh.loops.foreach_set("vertex_index", triangles.astype(np.int32).ravel())
+
+    mesh.polygons.add(num_tris)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, triangles.size, 3, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
+
+
 def create_box_from_extents(mesh, bbmin, bbmax):
     # Create box from bbmin and bbmax
     vertices = get_corners_from_extents(bbmin, bbmax)
@@ -349,22 +370,27 @@ def get_total_bounds(obj):
 
 def get_combined_bound_box(obj: bpy.types.Object, use_world: bool = False, matrix: Matrix = Matrix()):
     """Adds the ``bound_box`` of ``obj`` and all of it's child mesh objects. Returhs bbmin, bbmax"""
-    total_bounds: list[Vector] = []
+    # Accumulate into preallocated arrays instead of creating a Vector for each corner of each child
+    bbmin = np.full(3, np.inf)
+    bbmax = np.full(3, -np.inf)
+    has_bounds = False
 
     for child in [obj, *obj.children_recursive]:
         if child.type != "MESH":
             continue
 
-        child_matrix = matrix @ (
-            child.matrix_world if use_world else child.matrix_basis)
+        child_matrix = np.array(matrix @ (
+            child.matrix_world if use_world else child.matrix_basis))
 
-        total_bounds.extend([child_matrix @ Vector(v)
-                            for v in child.bound_box])
+        corners = np.array(child.bound_box, dtype=np.float64) @ child_matrix[:3, :3].T + child_matrix[:3, 3]
+        np.minimum(bbmin, corners.min(axis=0), out=bbmin)
+        np.maximum(bbmax, corners.max(axis=0), out=bbmax)
+        has_bounds = True
 
-    if not total_bounds:
+    if not has_bounds:
         return Vector(), Vector()
 
-    return get_min_vector_list(total_bounds), get_max_vector_list(total_bounds)
+    return Vector(bbmin), Vector(bbmax)
 
 
 def get_bound_center(obj):
@@ -1,6 +1,6 @@
 import os
+import numpy as np
 from numpy.typing import NDArray
-from math import sqrt
 from typing import Tuple
 from mathutils import Vector, Quaternion, Matrix
 
@@ -42,90 +42,63 @@ def abs_vector(v):
 
 
 def vector_inv(v):
-    r = Vector((0, 0, 0))
-    r.x = 1 / v.x if v.x != 0 else 0
-    r.y = 1 / v.y if v.y != 0 else 0
-    r.z = 1 / v.z if v.z != 0 else 0
-    return r
+    """Component-wise reciprocal of ``v``, zero components stay zero."""
+    return Vector([1 / c if c != 0 else 0 for c in v.xyz])
 
 
 def subtract_from_vector(v, f):
-    r = Vector((0, 0, 0))
-    r.x = v.x - f
-    r.y = v.y - f
-    r.z = v.z - f
-    return r
+    return Vector((v.x - f, v.y - f, v.z - f))
 
 
 def add_to_vector(v, f):
-    r = Vector((0, 0, 0))
-    r.x = v.x + f
-    r.y = v.y + f
-    r.z = v.z + f
-    return r
+    return Vector((v.x + f, v.y + f, v.z + f))
 
 
 def get_min_vector(v, c):
-    r = Vector((0, 0, 0))
-    r.x = min(v.x, c.x)
-    r.y = min(v.y, c.y)
-    r.z = min(v.z, c.z)
-    return r
+    return Vector((min(v.x, c.x), min(v.y, c.y), min(v.z, c.z)))
 
 
 def get_max_vector(v, c):
-    r = Vector((0, 0, 0))
-    r.x = max(v.x, c.x)
-    r.y = max(v.y, c.y)
-    r.z = max(v.z, c.z)
-    return r
+    return Vector((max(v.x, c.x), max(v.y, c.y), max(v.z, c.z)))
+
+
+def _vector_list_to_np_arr(vecs) -> NDArray[np.float64]:
+    """Get a Nx3 array from a sequence (or iterable) of 3D vectors."""
+    if not isinstance(vecs, np.ndarray):
+        vecs = np.array(list(vecs), dtype=np.float64)
+
+    return vecs
 
 
 def get_min_vector_list(vecs: list[Vector]):
     """Get a Vector composed of the smallest components of all given Vectors."""
-    if not vecs:
+    arr = _vector_list_to_np_arr(vecs)
+    if arr.size == 0:
         return Vector()
 
-    x = []
-    y = []
-    z = []
-    for v in vecs:
-        x.append(v[0])
-        y.append(v[1])
-        z.append(v[2])
-    return Vector((min(x), min(y), min(z)))
+    return Vector(arr[:, :3].min(axis=0))
 
 
 def get_max_vector_list(vecs: list[Vector]):
     """Get a Vector composed of the largest components of all given Vectors."""
-    if not vecs:
+    arr = _vector_list_to_np_arr(vecs)
+    if arr.size == 0:
         return Vector()
 
-    x = []
-    y = []
-    z = []
-    for v in vecs:
-        x.append(v[0])
-        y.append(v[1])
-        z.append(v[2])
-    return Vector((max(x), max(y), max(z)))
+    return Vector(arr[:, :3].max(axis=0))
 
 
 def get_distance_of_vectors(a, b):
-    locx = b.x - a.x
-    locy = b.y - a.y
-    locz = b.z - a.z
-
-    distance = sqrt((locx) ** 2 + (locy) ** 2 + (locz) ** 2)
-    return distance
+    return (b - a).length
 
 
 def get_direction_of_vectors(a, b):
-    direction = (a - b).normalized()
     axis_align = Vector((0.0, 0.0, 1.0))
 
     if a == b:
         direction = axis_align
+    else:
+        direction = (a - b).normalized()
 
     angle = axis_align.angle(direction)
     axis = axis_align.cross(direction)
@@ -161,19 +134,30 @@ def get_filename(filepath: str):
     return os.path.basename(filepath).split(".")[0]
 
 
-def np_arr_to_str(arr: NDArray, fmt: str):
+def np_arr_to_str(arr: NDArray, fmt: str, chunk_rows: int = 4096):
     """Convert numpy array to formatted string (faster than np.savetxt)"""
     n_fmt_chars = fmt.count('%')
 
     if arr.ndim == 1 and n_fmt_chars == 1:
         fmt = ' '.join([fmt] * arr.size)
-    else:
-        if n_fmt_chars == 1:
-            fmt = ' '.join([fmt] * arr.shape[1])
+        return fmt % tuple(arr.tolist())
+
+    if n_fmt_chars == 1:
+        fmt = ' '.join([fmt] * arr.shape[1])
+
+    # Format in chunks of rows so the format string and the tuple of values stay small with large arrays.
+    # tolist() converts to Python scalars in C, much cheaper than formatting numpy scalars one by one
+    num_rows = arr.shape[0]
+    chunk_fmt = '\n'.join([fmt] * min(num_rows, chunk_rows))
+    chunks = []
+    for row_start in range(0, num_rows, chunk_rows):
+        chunk = arr[row_start:row_start + chunk_rows]
+        if len(chunk) < chunk_rows:
+            chunk_fmt = '\n'.join([fmt] * len(chunk))
 
-        fmt = '\n'.join([fmt] * arr.shape[0])
+        chunks.append(chunk_fmt % tuple(chunk.ravel().tolist()))
 
-    return fmt % tuple(arr.ravel())
+    return '\n'.join(chunks)
 
 
 def get_matrix_without_scale(matrix: Matrix) -> Matrix:
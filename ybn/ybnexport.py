@@ -24,6 +24,15 @@ from ..cwxml.bound import (
     PolyCylinder,
     Material
 )
+from ..shared.geometry import (
+    get_centroid_of_box, get_mass_properties_of_box,
+    get_centroid_of_disc, get_mass_properties_of_disc,
+    get_centroid_of_sphere, get_mass_properties_of_sphere,
+    get_centroid_of_cylinder, get_mass_properties_of_cylinder,
+    get_centroid_of_capsule, get_mass_properties_of_capsule,
+    get_centroid_of_mesh, get_mass_properties_of_mesh,
+    grow_sphere
+)
 from ..tools.utils import get_max_vector_list, get_min_vector_list, get_matrix_without_scale
 from ..tools.meshhelper import (
     get_bound_center_from_bounds,
@@ -101,16 +110,6 @@ def create_bound_xml(obj: bpy.types.Object, is_root: bool = False) -> BoundChild
         logger.warning(f"'{obj.name}' has no collision materials! Skipping...")
         return
 
-    from ..shared.geometry import (
-        get_centroid_of_box, get_mass_properties_of_box,
-        get_centroid_of_disc, get_mass_properties_of_disc,
-        get_centroid_of_sphere, get_mass_properties_of_sphere,
-        get_centroid_of_cylinder, get_mass_properties_of_cylinder,
-        get_centroid_of_capsule, get_mass_properties_of_capsule,
-        get_centroid_of_mesh, get_mass_properties_of_mesh,
-        grow_sphere
-    )
-
     match obj.sollum_type:
         case SollumType.BOUND_BOX:
             bound_xml = init_bound_child_xml(BoundBox(), obj)
@@ -174,7 +173,7 @@ def create_bound_xml(obj: bpy.types.Object, is_root: bool = False) -> BoundChild
         case SollumType.BOUND_GEOMETRY:
             bound_xml = create_bound_geometry_xml(obj)
 
-            mesh_vertices = np.array([(v + bound_xml.geometry_center) for v in bound_xml.vertices])
+            mesh_vertices = np.array(bound_xml.vertices, dtype=np.float64).reshape((-1, 3)) + bound_xml.geometry_center
             mesh_faces = []
             for poly in bound_xml.polygons:
                 mesh_faces.append([poly.v1, poly.v2, poly.v3])
@@ -190,7 +189,7 @@ def create_bound_xml(obj: bpy.types.Object, is_root: bool = False) -> BoundChild
         case SollumType.BOUND_GEOMETRYBVH:
             bound_xml = create_bvh_xml(obj)
 
-            mesh_vertices = np.array([(v + bound_xml.geometry_center) for v in bound_xml.vertices])
+            mesh_vertices = np.array(bound_xml.vertices, dtype=np.float64).reshape((-1, 3)) + bound_xml.geometry_center
             mesh_faces = []
             primitives = []
             for poly in bound_xml.polygons:
@@ -29,6 +29,7 @@ from ..tools.meshhelper import (
     create_capsule,
     create_disc,
     create_color_attr,
+    create_triangle_mesh_geometry,
 )
 from ..tools.utils import get_direction_of_vectors, get_distance_of_vectors, abs_vector
 from ..tools.blenderhelper import create_blender_object, create_empty_object
@@ -374,7 +375,9 @@ def create_bound_mesh_data(
 
     verts, faces, colors = get_bound_geom_mesh_data(vertices, triangles, vertex_colors)
 
-    mesh.from_pydata(verts, [], faces)
+    verts = np.array(verts, dtype=np.float32).reshape((-1, 3))
+    faces = np.array(faces, dtype=np.int32).reshape((-1, 3))
+    create_triangle_mesh_geometry(mesh, verts, faces)
 
     if colors is not None:
         create_color_attr(mesh, 0, initial_values=colors)
@@ -390,8 +393,8 @@ def apply_bound_geom_materials(mesh: bpy.types.Mesh, triangles: list[PolyTriangl
     for mat in materials:
         mesh.materials.append(mat)
 
-    for i, poly_xml in enumerate(triangles):
-        mesh.polygons[i].material_index = poly_xml.material_index
+    material_inds = np.array([poly_xml.material_index for poly_xml in triangles], dtype=np.int32)
+    mesh.polygons.foreach_set("material_index", material_inds)
 
 
 def get_bound_geom_mesh_data(
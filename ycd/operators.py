@@ -256,7 +256,6 @@ class SOLLUMZ_OT_clip_new_tag(SOLLUMZ_OT_base, bpy.types.Operator):
         return {"FINISHED"}
 
     def apply_template(self, tag):
-        print(self.ignore_template, self.template)
         if self.ignore_template or self.template == "EMPTY":
             return
 
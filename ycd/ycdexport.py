@@ -204,9 +204,8 @@ def sequence_items_from_action(
     # resulting all values that are not passing this statement to "lag" in game.
     # (because of incorrect interpolation direction)
     # So what we do is make all values to pass Dot(start, end) >= 0f statement
-    quaternion_tracks = list(map(lambda kvp: kvp[0],
-                                 filter(lambda kvp: kvp[1] == TrackFormat.Quaternion,
-                                        TrackFormatMap.items())))
+    quaternion_tracks = [track for track, track_format in TrackFormatMap.items()
+                         if track_format == TrackFormat.Quaternion]
     for bone_id, bone_sequences in sequence_items.items():
         for track in quaternion_tracks:
             quats = bone_sequences.get(track, None)
@@ -167,9 +167,9 @@ def apply_action_data_to_action(action_data: ActionData, action: bpy.types.Actio
             track_format = TrackFormatMap[track]
             data_path = get_canonical_track_data_path(track, bone_id)
             if track_format == TrackFormat.Vector3:
-                vec_tracks_x = list(map(lambda vec: vec.x, frames_data))
-                vec_tracks_y = list(map(lambda vec: vec.y, frames_data))
-                vec_tracks_z = list(map(lambda vec: vec.z, frames_data))
+                vec_tracks_x = [vec.x for vec in frames_data]
+                vec_tracks_y = [vec.y for vec in frames_data]
+                vec_tracks_z = [vec.z for vec in frames_data]
 
                 vec_curve_x = action.fcurves.new(data_path=data_path, index=0)
                 vec_curve_y = action.fcurves.new(data_path=data_path, index=1)
@@ -191,10 +191,10 @@ def apply_action_data_to_action(action_data: ActionData, action: bpy.types.Actio
                 vec_curve_y.update()
                 vec_curve_z.update()
             elif track_format == TrackFormat.Quaternion:
-                quat_tracks_x = list(map(lambda rotation: rotation.x, frames_data))
-                quat_tracks_y = list(map(lambda rotation: rotation.y, frames_data))
-                quat_tracks_z = list(map(lambda rotation: rotation.z, frames_data))
-                quat_tracks_w = list(map(lambda rotation: rotation.w, frames_data))
+                quat_tracks_x = [rotation.x for rotation in frames_data]
+                quat_tracks_y = [rotation.y for rotation in frames_data]
+                quat_tracks_z = [rotation.z for rotation in frames_data]
+                quat_tracks_w = [rotation.w for rotation in frames_data]
 
                 quat_curve_w = action.fcurves.new(data_path=data_path, index=0)
                 quat_curve_x = action.fcurves.new(data_path=data_path, index=1)
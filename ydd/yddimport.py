@@ -1,5 +1,6 @@
 import bpy
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from ..cwxml.drawable import YDD, DrawableDictionary, Skeleton
 from ..cwxml.fragment import YFT, Fragment
@@ -15,19 +16,26 @@ from .. import logger
 def import_ydd(filepath: str):
     import_settings = get_import_settings()
 
-    ydd_xml = YDD.from_xml_file(filepath)
+    yft_filepath = get_external_skeleton_path(filepath) if import_settings.import_ext_skeleton else None
+    if yft_filepath is None:
+        ydd_xml = YDD.from_xml_file(filepath)
+        return create_ydd_obj(ydd_xml, filepath)
 
-    if import_settings.import_ext_skeleton:
-        skel_yft = load_external_skeleton(filepath)
+    # Read the external skeleton in the background while the YDD is parsed. Only the XML parsing happens in the
+    # worker thread, the logging and Blender data creation must stay in the main thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        skel_future = executor.submit(YFT.skeleton_from_xml_file, yft_filepath)
+        ydd_xml = YDD.from_xml_file(filepath)
+        skel_yft = skel_future.result()
 
-        if skel_yft is not None and skel_yft.drawable.skeleton is not None:
-            return create_ydd_obj_ext_skel(ydd_xml, filepath, skel_yft)
+    if skel_yft.drawable.skeleton is not None:
+        return create_ydd_obj_ext_skel(ydd_xml, filepath, skel_yft)
 
     return create_ydd_obj(ydd_xml, filepath)
 
 
-def load_external_skeleton(ydd_filepath: str) -> Optional[Fragment]:
-    """Read first yft at ydd_filepath into a Fragment"""
+def get_external_skeleton_path(ydd_filepath: str) -> Optional[str]:
+    """Get the path of the first yft next to ``ydd_filepath``, to use as external skeleton."""
     directory = os.path.dirname(ydd_filepath)
 
     yft_filepath = get_first_yft_path(directory)
@@ -35,17 +43,18 @@ def load_external_skeleton(ydd_filepath: str) -> Optional[Fragment]:
     if yft_filepath is None:
         logger.warning(
             f"Could not find external skeleton yft in directory '{directory}'.")
-        return
+        return None
 
     logger.info(f"Using '{yft_filepath}' as external skeleton...")
 
-    return YFT.from_xml_file(yft_filepath)
+    return yft_filepath
 
 
 def get_first_yft_path(directory: str):
-    for filepath in os.listdir(directory):
-        if filepath.endswith(".yft.xml"):
-            return os.path.join(directory, filepath)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".yft.xml") and entry.is_file():
+                return entry.path
 
 
 def create_ydd_obj_ext_skel(ydd_xml: DrawableDictionary, filepath: str, external_skel: Fragment):
@@ -53,14 +62,14 @@ def create_ydd_obj_ext_skel(ydd_xml: DrawableDictionary, filepath: str, external
     name = get_filename(filepath)
     dict_obj = create_armature_parent(name, external_skel)
 
-    for drawable_xml in ydd_xml:
-        external_bones = None
-        external_armature = None
-
-        if not drawable_xml.skeleton.bones:
-            external_bones = external_skel.drawable.skeleton.bones
+    external_skel_bones = external_skel.drawable.skeleton.bones
 
-        if not drawable_xml.skeleton.bones:
+    for drawable_xml in ydd_xml:
+        if drawable_xml.skeleton.bones:
+            external_bones = None
+            external_armature = None
+        else:
+            external_bones = external_skel_bones
             external_armature = dict_obj
 
         drawable_obj = create_drawable_obj(
@@ -76,12 +85,10 @@ def create_ydd_obj(ydd_xml: DrawableDictionary, filepath: str):
     dict_obj = create_empty_object(SollumType.DRAWABLE_DICTIONARY, name)
 
     ydd_skel = find_first_skel(ydd_xml)
+    ydd_skel_bones = ydd_skel.bones if ydd_skel is not None else None
 
     for drawable_xml in ydd_xml:
-        if not drawable_xml.skeleton.bones and ydd_skel is not None:
-            external_bones = ydd_skel.bones
-        else:
-            external_bones = None
+        external_bones = ydd_skel_bones if not drawable_xml.skeleton.bones else None
 
         drawable_obj = create_drawable_obj(
             drawable_xml, filepath, external_bones=external_bones)
@@ -2,7 +2,6 @@ import bpy
 from bpy.types import (
     Context,
     Operator,
-    Attribute,
 )
 from bpy.props import (
     FloatProperty,
@@ -51,18 +50,26 @@ class CableSetAttributeBase(CableEditRestrictedHelper):
         if not mesh_has_cable_attribute(mesh, self.attribute):
             mesh_add_cable_attribute(mesh, self.attribute)
 
-        attr = mesh.attributes[self.attribute]
-        for v in mesh.vertices:
-            if not v.select:
-                continue
+        num_verts = len(mesh.vertices)
+        selected = np.empty(num_verts, dtype=bool)
+        mesh.vertices.foreach_get("select", selected)
 
-            self.do_set_attribute(v.index, attr)
+        attr = mesh.attributes[self.attribute]
+        attr_type = self.attribute.type
+        field = "vector" if attr_type == "FLOAT_VECTOR" else "value"
+        num_components = 3 if attr_type == "FLOAT_VECTOR" else 1
+        values = np.empty(num_verts * num_components, dtype=np.int32 if attr_type == "INT" else np.float32)
+        attr.data.foreach_get(field, values)
+        values = values.reshape((num_verts, num_components))
+        values[selected] = self.get_attribute_value()
+        attr.data.foreach_set(field, values.ravel())
 
         bpy.ops.object.mode_set(mode=mode)
         return {"FINISHED"}
 
-    def do_set_attribute(self, vertex_index: int, attr: Attribute):
-        attr.data[vertex_index].value = self.value
+    def get_attribute_value(self):
+        """Gets the value to set on the selected vertices."""
+        return self.value
 
 
 class SOLLUMZ_OT_cable_set_radius(Operator, CableSetAttributeBase):
@@ -121,9 +128,9 @@ class SOLLUMZ_OT_cable_set_phase_offset(Operator, CableSetAttributeBase):
         size=2, min=0.0, max=1.0, default=CableAttr.PHASE_OFFSET.default_value[0:2]
     )
 
-    def do_set_attribute(self, vertex_index: int, attr: Attribute):
+    def get_attribute_value(self):
         x, y = self.value
-        attr.data[vertex_index].vector = x, y, 0.0
+        return x, y, 0.0
 
 
 
@@ -149,12 +156,17 @@ class SOLLUMZ_OT_cable_randomize_phase_offset(Operator, CableRestrictedHelper):
                 mesh_add_cable_attribute(mesh, CableAttr.PHASE_OFFSET)
 
             attr = mesh.attributes[CableAttr.PHASE_OFFSET]
+            values = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            attr.data.foreach_get("vector", values)
+            values = values.reshape((-1, 3))
+
             pieces = edge_loops_from_edges(mesh)
             phase_offsets = np.random.default_rng().random((len(pieces), 2))
             for i, piece in enumerate(pieces):
-                x, y = phase_offsets[i]
-                for vi in piece:
-                    attr.data[vi].vector = x, y, 0.0
+                values[piece, :2] = phase_offsets[i]
+                values[piece, 2] = 0.0
+
+            attr.data.foreach_set("vector", values.ravel())
 
             bpy.ops.object.mode_set(mode=mode)
 
@@ -8,6 +8,7 @@ from gpu_extras.batch import batch_for_shader
 import blf
 from mathutils import Vector
 from collections.abc import Sequence
+from itertools import chain
 from typing import NamedTuple
 from .cable import (
     CableAttr,
@@ -17,6 +18,7 @@ from .cable import (
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 from bpy_extras.mesh_utils import edge_loops_from_edges
 import bmesh
+import numpy as np
 
 
 class CableOverlaysDrawHandler:
@@ -25,6 +27,9 @@ class CableOverlaysDrawHandler:
     def __init__(self):
         self.handler_text = None
         self.handler_geometry = None
+        # (cache key, batch) of the last radius geometry drawn in object mode
+        self._radius_batch_cache = None
+        self._shader = None
 
     def register(self):
         self.handler_text = SpaceView3D.draw_handler_add(self.draw_text, (), "WINDOW", "POST_PIXEL")
@@ -131,88 +136,113 @@ class CableOverlaysDrawHandler:
 
     def draw_radius_geometry(self, cable_obj: Object):
         mesh = cable_obj.data
+        matrix_world = np.array(cable_obj.matrix_world, dtype=np.float32)
         if cable_obj.mode == "EDIT":
+            # Edit mode has no cheap way to detect changes, just rebuild every redraw
+            self._radius_batch_cache = None
+
             edit_mesh = bmesh.from_edit_mesh(mesh)
             edit_edges = [TempEditEdge((e.verts[0].index, e.verts[1].index))for e in edit_mesh.edges]
             pieces = edge_loops_from_edges(None, edges=edit_edges)
-        else:
-            pieces = edge_loops_from_edges(mesh)
 
-        coords = []
-        for piece in pieces:
-            coords.extend(self.build_radius_geometry_for_cable_piece(cable_obj, piece))
+            # BMesh has no foreach_get, but streaming the components straight into the array is still much faster
+            # than building a list of vectors first
+            edit_verts = edit_mesh.verts
+            num_verts = len(edit_verts)
+            positions = np.fromiter(chain.from_iterable(v.co for v in edit_verts), dtype=np.float32, count=num_verts * 3)
+            positions = positions.reshape((num_verts, 3))
+            radius_layer = edit_verts.layers.float.get(CableAttr.RADIUS, None)
+            if radius_layer is None:
+                radius_values = np.full(num_verts, CableAttr.RADIUS.default_value, dtype=np.float32)
+            else:
+                radius_values = np.fromiter((v[radius_layer] for v in edit_verts), dtype=np.float32, count=num_verts)
 
-        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
-        batch = batch_for_shader(shader, "LINES", {"pos": coords})
+            batch = self.build_radius_geometry_batch(pieces, positions, radius_values, matrix_world)
+        else:
+            positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", positions)
+            positions = positions.reshape((-1, 3))
+            radius_values = mesh_get_cable_attribute_values(mesh, CableAttr.RADIUS)
+            edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+            mesh.edges.foreach_get("vertices", edges)
+
+            # Reuse the batch while the mesh is unchanged, i.e. when only the view changes
+            cache_key = (
+                mesh.as_pointer(),
+                matrix_world.tobytes(),
+                positions.tobytes(),
+                radius_values.tobytes(),
+                edges.tobytes(),
+            )
+            cached = self._radius_batch_cache
+            if cached is not None and cached[0] == cache_key:
+                batch = cached[1]
+            else:
+                pieces = edge_loops_from_edges(mesh)
+                batch = self.build_radius_geometry_batch(pieces, positions, radius_values, matrix_world)
+                self._radius_batch_cache = (cache_key, batch)
+
+        shader = self.get_shader()
         shader.uniform_float("color", (1.0, 0.0, 0.0, 1.0))
         batch.draw(shader)
 
-    def build_radius_geometry_for_cable_piece(self, cable_obj: Object, piece: list[int]) -> list[Vector]:
+    def get_shader(self) -> gpu.types.GPUShader:
+        """Gets the shader used to draw the overlays geometry. Created on first use, the GPU module is not available
+        yet when the add-on is registered."""
+        if self._shader is None:
+            self._shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+
+        return self._shader
+
+    def build_radius_geometry_batch(
+        self,
+        pieces: list[list[int]],
+        positions: np.ndarray,
+        radius_values: np.ndarray,
+        matrix_world: np.ndarray
+    ) -> gpu.types.GPUBatch:
+        coords = [self.build_radius_geometry_for_cable_piece(positions[piece], radius_values[piece], matrix_world)
+                  for piece in pieces]
+        coords = np.concatenate(coords) if coords else np.empty((0, 3), dtype=np.float32)
+
+        return batch_for_shader(self.get_shader(), "LINES", {"pos": coords})
+
+    def build_radius_geometry_for_cable_piece(
+        self,
+        positions: np.ndarray,
+        radius_values: np.ndarray,
+        matrix_world: np.ndarray
+    ) -> np.ndarray:
         """Builds the geometry to visualize the radius of this cable piece. The radius is represented with 4 lines
-        around the cable mesh.
+        around the cable mesh. ``positions`` and ``radius_values`` are the local positions and radius of the piece
+        vertices, in order.
         """
-        num_piece_verts = len(piece)
-        mesh = cable_obj.data
-        matrix_world = cable_obj.matrix_world
+        num_piece_verts = len(positions)
+        if num_piece_verts < 2:
+            return np.empty((0, 3), dtype=np.float32)
 
-        num_verts_per_line = (num_piece_verts * 2 - 2)
-        num_lines = 4
-        coords = [None] * (num_lines * num_verts_per_line)
+        tangents = np.empty_like(positions)
+        tangents[1:] = positions[1:] - positions[:-1]
+        tangents[0] = tangents[1]
+        tangents = _normalized(tangents)
 
-        def _add_piece_vertex(index_in_piece: int, pos: Vector, tangent: Vector, radius: float):
-            world_up = Vector((0.0, 0.0, 1.0))
-            right = tangent.cross(world_up).normalized()
-            up = tangent.cross(right).normalized()
-            pos = matrix_world @ pos
-            va = pos + up * radius
-            vb = pos - up * radius
-            vc = pos + right * radius
-            vd = pos - right * radius
-            verts_per_line = (va, vb, vc, vd)
-            if index_in_piece == 0:
-                for k in range(num_lines):
-                    coords[(num_verts_per_line * k) + 0] = verts_per_line[k]
-            elif index_in_piece == (num_piece_verts - 1):
-                for k in range(num_lines):
-                    coords[(num_verts_per_line * (k + 1)) - 1] = verts_per_line[k]
-            else:
-                for k in range(num_lines):
-                    coords[(num_verts_per_line * k) + index_in_piece * 2 - 1] = verts_per_line[k]
-                    coords[(num_verts_per_line * k) + index_in_piece * 2] = verts_per_line[k]
+        world_up = np.array((0.0, 0.0, 1.0), dtype=np.float32)
+        right = _normalized(np.cross(tangents, world_up))
+        up = _normalized(np.cross(tangents, right))
+        right *= radius_values[:, None]
+        up *= radius_values[:, None]
 
-        if cable_obj.mode == "EDIT":
-            edit_mesh = bmesh.from_edit_mesh(mesh)
-            radius_layer = edit_mesh.verts.layers.float.get(CableAttr.RADIUS, None)
-            prev_pos = None
-            for i, vi in enumerate(piece):
-                v = edit_mesh.verts[vi]
-                radius_value = CableAttr.RADIUS.default_value if radius_layer is None else v[radius_layer]
-                if prev_pos is None:
-                    if i + 1 < num_piece_verts:
-                        tangent = (edit_mesh.verts[piece[i + 1]].co - v.co).normalized()
-                    else:
-                        tangent = Vector()
-                else:
-                    tangent = (v.co - prev_pos).normalized()
-                _add_piece_vertex(i, v.co, tangent, radius_value)
-                prev_pos = v.co
-        else:
-            radius_values = mesh_get_cable_attribute_values(mesh, CableAttr.RADIUS)
-            prev_pos = None
-            for i, vi in enumerate(piece):
-                v = mesh.vertices[vi]
-                radius_value = radius_values[vi]
-                if prev_pos is None:
-                    if i + 1 < num_piece_verts:
-                        tangent = (mesh.vertices[piece[i + 1]].co - v.co).normalized()
-                    else:
-                        tangent = Vector()
-                else:
-                    tangent = (v.co - prev_pos).normalized()
-                _add_piece_vertex(i, v.co, tangent, radius_value)
-                prev_pos = v.co
-
-        return coords
+        pos = positions @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+        verts_per_line = np.stack((pos + up, pos - up, pos + right, pos - right))
+
+        # Each line is made of the segments between consecutive vertices: v0 v1, v1 v2, ..., vN-1 vN
+        segment_verts = np.repeat(np.arange(num_piece_verts), 2)[1:-1]
+        return verts_per_line[:, segment_verts].reshape((-1, 3)).astype(np.float32, copy=False)
+
+
+def _normalized(vectors: np.ndarray) -> np.ndarray:
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths != 0)
 
 
 class TempEditEdge(NamedTuple):
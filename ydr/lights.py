@@ -5,6 +5,7 @@ from mathutils import Matrix, Vector
 from .light_flashiness import Flashiness
 from ..sollumz_properties import SOLLUMZ_UI_NAMES, SollumType, LightType
 from ..tools.blenderhelper import create_empty_object, create_blender_object, add_child_of_bone_constraint
+from ..tools.jenkhash import name_to_hash
 from ..cwxml.drawable import Light
 from ..cwxml.ymap import LightInstance
 from .properties import LightProperties
@@ -353,6 +354,5 @@ def convert_light_to_light_instance_xml(light: Light) -> LightInstance:
     li.cone_outer_angle = light.cone_outer_angle
     li.extents = _vec_to_text_list(light.extent)
     li.shadow_blur = light.shadow_blur
-    from ..tools.jenkhash import name_to_hash
     li.projected_texture_key = name_to_hash(light.projected_texture_hash)
     return li
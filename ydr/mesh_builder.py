@@ -3,11 +3,11 @@ import numpy as np
 from numpy.typing import NDArray
 from traceback import format_exc
 from ..tools.meshhelper import (
+    create_triangle_mesh_geometry,
     create_uv_attr,
     create_color_attr,
     flip_uvs,
 )
-from mathutils import Vector
 from .. import logger
 
 
@@ -47,7 +47,7 @@ class MeshBuilder:
         faces = self.ind_arr.reshape((int(self.ind_arr.size / 3), 3))
 
         try:
-            mesh.from_pydata(vert_pos, [], faces)
+            create_triangle_mesh_geometry(mesh, vert_pos, faces)
         except Exception:
             logger.error(
                 f"Error during creation of fragment {self.name}:\n{format_exc()}\nEnsure the mesh data is not malformed.")
@@ -84,10 +84,13 @@ class MeshBuilder:
             "value", model_mat_inds[self.mat_inds])
 
     def set_mesh_normals(self, mesh: bpy.types.Mesh):
-        mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
 
-        normals_normalized = [Vector(n).normalized() for n in self.vertex_arr["Normal"]]
-        mesh.normals_split_custom_set_from_vertices(normals_normalized)
+        normals = self.vertex_arr["Normal"].astype(np.float32)
+        # Zero-length normals stay as zero, same as Vector.normalized()
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, lengths, out=normals, where=lengths != 0)
+        mesh.normals_split_custom_set_from_vertices(normals)
 
         if bpy.app.version < (4, 1, 0):
             # needed to use custom split normals pre-4.1
@@ -113,10 +116,19 @@ class MeshBuilder:
             create_color_attr(mesh, color_idx, initial_values=colors[self.ind_arr])
 
     def create_vertex_groups(self, obj: bpy.types.Object, bones: list[bpy.types.Bone]):
-        weights = self.vertex_arr["BlendWeights"] / 255
+        raw_weights = self.vertex_arr["BlendWeights"]
         indices = self.vertex_arr["BlendIndices"]
 
-        vertex_groups: dict[int, bpy.types.VertexGroup] = {}
+        # Flatten to one entry per vertex influence, in vertex order
+        num_influences = indices.shape[1]
+        vert_inds = np.repeat(np.arange(len(indices)), num_influences)
+        bone_inds = indices.ravel()
+        raw_weights = raw_weights.ravel()
+
+        used_mask = (raw_weights != 0) | (bone_inds != 0)
+        vert_inds = vert_inds[used_mask]
+        bone_inds = bone_inds[used_mask]
+        raw_weights = raw_weights[used_mask]
 
         def create_group(bone_index: int):
             bone_name = f"UNKNOWN_BONE.{bone_index}"
@@ -126,16 +138,26 @@ class MeshBuilder:
 
             return obj.vertex_groups.new(name=bone_name)
 
-        for vert_ind, bone_inds in enumerate(indices):
-            for i, bone_ind in enumerate(bone_inds):
-                weight = weights[vert_ind][i]
-
-                if weight == 0 and bone_ind == 0:
-                    continue
-
-                if bone_ind not in vertex_groups:
-                    vertex_groups[bone_ind] = create_group(bone_ind)
-
-                vgroup = vertex_groups[bone_ind]
-
-                vgroup.add((vert_ind,), weight, "ADD")
+        # Create the groups in the order the bones are first referenced
+        unique_bone_inds, first_occurrences = np.unique(bone_inds, return_index=True)
+        vertex_groups: dict[int, bpy.types.VertexGroup] = {
+            bone_ind: create_group(bone_ind) for bone_ind in unique_bone_inds[np.argsort(first_occurrences)].tolist()
+        }
+
+        # Sort influences by bone and weight, so all vertices with the same weight on the same bone can be added to
+        # the group in a single call
+        order = np.lexsort((raw_weights, bone_inds))
+        vert_inds = vert_inds[order]
+        bone_inds = bone_inds[order]
+        raw_weights = raw_weights[order]
+
+        run_starts = np.flatnonzero((bone_inds[1:] != bone_inds[:-1]) | (raw_weights[1:] != raw_weights[:-1])) + 1
+        run_starts = np.concatenate(([0], run_starts)).tolist()
+        run_ends = run_starts[1:] + [len(bone_inds)]
+
+        for start, end in zip(run_starts, run_ends):
+            if start == end:
+                continue
+
+            vgroup = vertex_groups[int(bone_inds[start])]
+            vgroup.add(vert_inds[start:end].tolist(), raw_weights[start] / 255, "ADD")
@@ -280,7 +280,9 @@ def get_model_joined_ind_arr(geoms: list[Geometry]) -> NDArray[np.uint32]:
 
 def get_model_joined_vert_arr(geoms: list[Geometry]) -> NDArray:
     arr_dtype = get_model_vert_buffer_dtype(geoms)
-    vert_arrs: list[NDArray] = []
+    num_verts = sum(len(geom.vertex_buffer.data) for geom in geoms if geom.vertex_buffer.data is not None)
+    joined_arr = np.zeros(num_verts, dtype=arr_dtype)
+    row_start = 0
 
     for geom in geoms:
         vert_arr = geom.vertex_buffer.data
@@ -291,14 +293,15 @@ def get_model_joined_vert_arr(geoms: list[Geometry]) -> NDArray:
         if geom.bone_ids:
             apply_bone_ids(vert_arr, np.array(geom.bone_ids))
 
-        geom_vert_arr = np.zeros(len(vert_arr), dtype=arr_dtype)
+        row_end = row_start + len(vert_arr)
+        geom_rows = joined_arr[row_start:row_end]
 
         for name in vert_arr.dtype.names:
-            geom_vert_arr[name] = vert_arr[name]
+            geom_rows[name] = vert_arr[name]
 
-        vert_arrs.append(geom_vert_arr)
+        row_start = row_end
 
-    return np.concatenate(vert_arrs)
+    return joined_arr
 
 
 def get_model_vert_buffer_dtype(geoms: list[Geometry]) -> np.dtype:
@@ -152,23 +152,42 @@ class VertexBufferBuilder:
         num_verts = len(self.mesh.vertices)
         bone_by_vgroup = self._bone_by_vgroup
 
-        ind_arr = np.zeros((num_verts, 4), dtype=np.uint32)
-        weights_arr = np.zeros((num_verts, 4), dtype=np.float32)
-
-        ungrouped_verts = 0
-
+        # Flatten the vertex group elements of all vertices, skipping the groups that don't have a corresponding bone
+        elem_vert_inds = []
+        elem_bone_inds = []
+        elem_weights = []
         for i, vert in enumerate(self.mesh.vertices):
-            groups = self._get_sorted_vertex_group_elements(vert)
-            if not groups:
-                ungrouped_verts += 1
-                continue
+            for element in vert.groups:
+                bone_index = bone_by_vgroup.get(element.group, -1)
+                if bone_index == -1:
+                    continue
+
+                elem_vert_inds.append(i)
+                elem_bone_inds.append(bone_index)
+                elem_weights.append(element.weight)
+
+        elem_vert_inds = np.array(elem_vert_inds, dtype=np.int64)
+        elem_bone_inds = np.array(elem_bone_inds, dtype=np.uint32)
+        elem_weights = np.array(elem_weights, dtype=np.float32)
+
+        # Sort the elements of each vertex by weight, so the groups with less influence are to be ignored. Elements
+        # with the same weight keep their order
+        num_elems = len(elem_vert_inds)
+        order = np.lexsort((np.arange(num_elems), -elem_weights, elem_vert_inds))
+        elem_vert_inds = elem_vert_inds[order]
+        elem_bone_inds = elem_bone_inds[order]
+        elem_weights = elem_weights[order]
+
+        # Position of each element within its vertex, only the first 4 are kept
+        elem_slots = np.arange(num_elems) - np.searchsorted(elem_vert_inds, elem_vert_inds, side="left")
+        used_mask = elem_slots < 4
 
-            for j, grp in enumerate(groups):
-                if j > 3:
-                    break
+        ind_arr = np.zeros((num_verts, 4), dtype=np.uint32)
+        weights_arr = np.zeros((num_verts, 4), dtype=np.float32)
+        ind_arr[elem_vert_inds[used_mask], elem_slots[used_mask]] = elem_bone_inds[used_mask]
+        weights_arr[elem_vert_inds[used_mask], elem_slots[used_mask]] = elem_weights[used_mask]
 
-                weights_arr[i][j] = grp.weight
-                ind_arr[i][j] = bone_by_vgroup[grp.group]
+        ungrouped_verts = num_verts - np.count_nonzero(elem_slots == 0)
 
         if ungrouped_verts != 0:
             logger.warning(
@@ -187,22 +206,6 @@ class VertexBufferBuilder:
         # Return on loop domain
         return weights_arr[self._vert_inds], ind_arr[self._vert_inds]
 
-    def _get_sorted_vertex_group_elements(self, vertex: bpy.types.MeshVertex) -> list[bpy.types.VertexGroupElement]:
-        elements = []
-        bone_by_vgroup = self._bone_by_vgroup
-        for element in vertex.groups:
-            bone_index = bone_by_vgroup.get(element.group, -1)
-
-            # skip the group that doesn't have a corresponding bone
-            if bone_index == -1:
-                continue
-
-            elements.append(element)
-
-        # sort by weight so the groups with less influence are to be ignored
-        elements = sorted(elements, reverse=True, key=lambda e: e.weight)
-        return elements
-
     def _sort_weights_inds(self, weights_arr: NDArray[np.float32], ind_arr: NDArray[np.uint32]):
         """Sort BlendWeights and BlendIndices."""
         # Blend weights and indices are sorted by weights in ascending order starting from the 3rd index and continues to the left
@@ -72,8 +72,9 @@ def export_ydr(drawable_obj: bpy.types.Object, filepath: str) -> bool:
     return True
 
 
-def create_drawable_xml(drawable_obj: bpy.types.Object, armature_obj: Optional[bpy.types.Object] = None, materials: Optional[list[bpy.types.Material]] = None, apply_transforms: bool = False):
-    """Create a ``Drawable`` cwxml object. Optionally specify an external ``armature_obj`` if ``drawable_obj`` is not an armature."""
+def create_drawable_xml(drawable_obj: bpy.types.Object, armature_obj: Optional[bpy.types.Object] = None, materials: Optional[list[bpy.types.Material]] = None, apply_transforms: bool = False, very_high_only: bool = False):
+    """Create a ``Drawable`` cwxml object. Optionally specify an external ``armature_obj`` if ``drawable_obj`` is not an armature.
+    If ``very_high_only`` is set, only the Very High LODs are exported, as the High LODs of the drawable."""
     drawable_xml = Drawable()
     drawable_xml.matrix = None
 
@@ -106,7 +107,7 @@ def create_drawable_xml(drawable_obj: bpy.types.Object, armature_obj: Optional[b
         bones = None
         original_pose = "POSE"
 
-    create_model_xmls(drawable_xml, drawable_obj, materials, bones)
+    create_model_xmls(drawable_xml, drawable_obj, materials, bones, very_high_only)
 
     drawable_xml.lights = create_xml_lights(drawable_obj)
 
@@ -121,20 +122,19 @@ def create_drawable_xml(drawable_obj: bpy.types.Object, armature_obj: Optional[b
     return drawable_xml
 
 
-def create_model_xmls(drawable_xml: Drawable, drawable_obj: bpy.types.Object, materials: list[bpy.types.Material], bones: Optional[list[bpy.types.Bone]] = None):
+def create_model_xmls(drawable_xml: Drawable, drawable_obj: bpy.types.Object, materials: list[bpy.types.Material], bones: Optional[list[bpy.types.Bone]] = None, very_high_only: bool = False):
     model_objs = get_model_objs(drawable_obj)
 
     if bones is not None:
         model_objs = sort_skinned_models_by_bone(model_objs, bones)
 
+    lod_levels = get_export_lod_levels(very_high_only)
+
     for model_obj in model_objs:
         transforms_to_apply = get_export_transforms_to_apply(model_obj)
 
         lods = model_obj.sz_lods
-        for lod_level in LODLevel:
-            if lod_level == LODLevel.VERYHIGH:
-                continue
-
+        for lod_level, xml_lod_level in lod_levels:
             lod = lods.get_lod(lod_level)
             if lod.mesh is None:
                 continue
@@ -143,7 +143,7 @@ def create_model_xmls(drawable_xml: Drawable, drawable_obj: bpy.types.Object, ma
             if not model_xml.geometries:
                 continue
 
-            append_model_xml(drawable_xml, model_xml, lod_level)
+            append_model_xml(drawable_xml, model_xml, xml_lod_level)
 
     # Drawables only ever have 1 skinned drawable model per LOD level. Since, the skinned portion of the
     # drawable can be split by vertex group, we have to join each separate part into a single object.
@@ -151,6 +151,15 @@ def create_model_xmls(drawable_xml: Drawable, drawable_obj: bpy.types.Object, ma
     split_drawable_by_vert_count(drawable_xml)
 
 
+def get_export_lod_levels(very_high_only: bool = False) -> list[tuple[LODLevel, LODLevel]]:
+    """Get the LOD levels to export as tuples (object LOD level, drawable XML LOD level). The Very High LOD is only
+    exported when ``very_high_only`` is set, and it is written as the High LOD (i.e. the _hi.yft drawable)."""
+    if very_high_only:
+        return [(LODLevel.VERYHIGH, LODLevel.HIGH)]
+
+    return [(lod_level, lod_level) for lod_level in LODLevel if lod_level != LODLevel.VERYHIGH]
+
+
 def get_model_objs(drawable_obj: bpy.types.Object) -> list[bpy.types.Object]:
     """Get all non-skinned Drawable Model objects under ``drawable_obj``."""
     return [obj for obj in drawable_obj.children if obj.sollum_type == SollumType.DRAWABLE_MODEL and not obj.sollumz_is_physics_child_mesh]
@@ -325,15 +334,18 @@ def get_loop_inds_by_material(mesh: bpy.types.Mesh, drawable_mats: list[bpy.type
     if not mesh.loop_triangles:
         mesh.calc_loop_triangles()
 
+    num_tris = len(mesh.loop_triangles)
+
     # Material indices for each triangle
-    tri_mat_indices = np.empty(len(mesh.loop_triangles), dtype=np.uint32)
+    tri_mat_indices = np.empty(num_tris, dtype=np.uint32)
     mesh.loop_triangles.foreach_get("material_index", tri_mat_indices)
 
-    # Material indices for each loop triangle
-    loop_mat_inds = np.repeat(tri_mat_indices, 3)
+    all_loop_inds = np.empty((num_tris, 3), dtype=np.uint32)
+    mesh.loop_triangles.foreach_get("loops", all_loop_inds.ravel())
 
-    all_loop_inds = np.empty(len(mesh.loop_triangles) * 3, dtype=np.uint32)
-    mesh.loop_triangles.foreach_get("loops", all_loop_inds)
+    # Group triangles by material index in a single pass. Stable sort keeps the triangle order within each material
+    tris_by_mat = np.argsort(tri_mat_indices, kind="stable")
+    mat_tris_start = np.searchsorted(tri_mat_indices[tris_by_mat], np.arange(len(mesh.materials) + 1))
 
     mat_inds: dict[str, int] = {mat: i for i, mat in enumerate(drawable_mats)}
 
@@ -345,12 +357,12 @@ def get_loop_inds_by_material(mesh: bpy.types.Mesh, drawable_mats: list[bpy.type
 
         # Get index of material on drawable (different from mesh material index)
         shader_index = mat_inds[original_mat]
-        tri_loop_inds = np.where(loop_mat_inds == i)[0]
+        mat_tris = tris_by_mat[mat_tris_start[i]:mat_tris_start[i + 1]]
 
-        if tri_loop_inds.size == 0:
+        if mat_tris.size == 0:
             continue
 
-        loop_indices = all_loop_inds[tri_loop_inds]
+        loop_indices = all_loop_inds[mat_tris].ravel()
 
         loop_inds_by_mat[shader_index] = loop_indices
 
@@ -452,21 +464,16 @@ def join_vert_arrs(vert_arrs: list[NDArray]):
     num_verts = sum(len(vert_arr) for vert_arr in vert_arrs)
     struct_dtype = get_joined_vert_arr_dtype(vert_arrs)
     joined_arr = np.zeros(num_verts, dtype=struct_dtype)
+    row_start = 0
 
-    for attr_name in joined_arr.dtype.names:
-        row_start = 0
-
-        for vert_arr in vert_arrs:
-            if attr_name not in vert_arr.dtype.names:
-                continue
-
-            attr = vert_arr[attr_name]
-            num_attr_verts = len(attr)
-            row_end = row_start + num_attr_verts
+    for vert_arr in vert_arrs:
+        row_end = row_start + len(vert_arr)
+        arr_rows = joined_arr[row_start:row_end]
 
-            joined_arr[attr_name][row_start:row_end] = attr
+        for attr_name in vert_arr.dtype.names:
+            arr_rows[attr_name] = vert_arr[attr_name]
 
-            row_start = row_end
+        row_start = row_end
 
     return joined_arr
 
@@ -916,9 +923,16 @@ def set_drawable_xml_properties(drawable_obj: bpy.types.Object, drawable_xml: Dr
 
 
 def write_embedded_textures(drawable_obj: bpy.types.Object, filepath: str):
+    copy_embedded_textures(get_embedded_texture_copies(drawable_obj, filepath))
+
+
+def get_embedded_texture_copies(drawable_obj: bpy.types.Object, filepath: str) -> list[tuple[str, str]]:
+    """Get the ``(source, destination)`` paths of the embedded textures to copy next to ``filepath``. Creates the
+    destination folder if needed."""
     materials = get_sollumz_materials(drawable_obj)
     directory = os.path.dirname(filepath)
     filename = get_filename(filepath)
+    texture_copies = []
 
     for node in get_embedded_texture_nodes(materials):
         folder_path = os.path.join(directory, filename)
@@ -928,12 +942,21 @@ def write_embedded_textures(drawable_obj: bpy.types.Object, filepath: str):
             if not os.path.isdir(folder_path):
                 os.mkdir(folder_path)
             dstpath = os.path.join(folder_path, os.path.basename(texture_path))
-            # check if paths are the same because if they are, no need to copy (and would throw an error otherwise)
-            if not os.path.exists(dstpath) or not os.path.samefile(texture_path, dstpath):
-                shutil.copyfile(texture_path, dstpath)
+            texture_copies.append((texture_path, dstpath))
         elif texture_path:
             logger.warning(f"Texture path '{texture_path}' for {node.name} not found! Skipping texture...")
 
+    return texture_copies
+
+
+def copy_embedded_textures(texture_copies: list[tuple[str, str]]):
+    """Copy the embedded textures returned by ``get_embedded_texture_copies``. Only file I/O, doesn't access any
+    Blender data so it can run outside the main thread."""
+    for texture_path, dstpath in texture_copies:
+        # check if paths are the same because if they are, no need to copy (and would throw an error otherwise)
+        if not os.path.exists(dstpath) or not os.path.samefile(texture_path, dstpath):
+            shutil.copyfile(texture_path, dstpath)
+
 
 def create_shader_parameters_list_template(shader_def: Optional[ShaderDef]) -> list[ShaderParameter]:
     """Creates a list of shader parameters ordered as defined in the ``ShaderDef`` parameters list.
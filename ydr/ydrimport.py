@@ -287,82 +287,82 @@ def shader_item_to_material(shader: Shader, shader_group: ShaderGroup, filepath:
     material.name = shader.name
     material.shader_properties.renderbucket = RenderBucket(shader.render_bucket).name
 
+    nodes = material.node_tree.nodes
+    embedded_textures = {}
+    if shader_group.texture_dictionary is not None:
+        embedded_textures = {texture.name: texture for texture in shader_group.texture_dictionary}
+
     for param in shader.parameters:
-        for n in material.node_tree.nodes:
-            if isinstance(n, bpy.types.ShaderNodeTexImage):
-                if param.name == n.name:
-                    texture_path = lookup_texture_file(param.texture_name, texture_folder)
-                    if texture_path is not None:
-                        img = bpy.data.images.load(str(texture_path), check_existing=True)
-                        n.image = img
-
-                    if not n.image:
-                        # for texture shader parameters with no name
-                        if not param.texture_name:
-                            continue
-                        # Check for existing texture
-                        existing_texture = None
-                        for image in bpy.data.images:
-                            if image.name == param.texture_name:
-                                existing_texture = image
-                        texture = bpy.data.images.new(
-                            name=param.texture_name, width=512, height=512) if not existing_texture else existing_texture
-                        n.image = texture
-
-                    # TODO: we could specify non-color textures in shaders.xml
-                    # assign non-color...
-                    if (
-                        "Bump" in param.name or  # ...to normal maps
-                        param.name == "distanceMapSampler" or  # ...to distance maps
-                        (filename == "decal_dirt.sps" and param.name == "DiffuseSampler") # ...to shadow maps
-                    ):
-                        n.image.colorspace_settings.name = "Non-Color"
-
-                    preferences = get_addon_preferences(bpy.context)
-                    text_name = preferences.use_text_name_as_mat_name
-                    if text_name:
-                        if param.texture_name and param.name == "DiffuseSampler":
-                            material.name = param.texture_name
-
-                    # Assign embedded texture dictionary properties
-                    if shader_group.texture_dictionary is not None:
-                        for texture in shader_group.texture_dictionary:
-                            if texture.name == param.texture_name:
-                                n.texture_properties.embedded = True
-                                try:
-                                    format = TextureFormat[texture.format.replace("D3DFMT_", "")]
-                                    n.texture_properties.format = format
-                                except AttributeError:
-                                    print(f"Failed to set texture format: format '{texture.format}' unknown.")
-
-                                try:
-                                    usage = TextureUsage[texture.usage]
-                                    n.texture_properties.usage = usage
-                                except AttributeError:
-                                    print(f"Failed to set texture usage: usage '{texture.usage}' unknown.")
-
-                                n.texture_properties.extra_flags = texture.extra_flags
-
-                                for prop in dir(n.texture_flags):
-                                    for uf in texture.usage_flags:
-                                        if uf.lower() == prop:
-                                            setattr(
-                                                n.texture_flags, prop, True)
-
-                    if not n.texture_properties.embedded and not n.image.filepath:
-                        # Set external texture name for non-embedded textures
-                        n.image.source = "FILE"
-                        n.image.filepath = "//" + param.texture_name + ".dds"
-
-            elif isinstance(n, SzShaderNodeParameter):
-                if param.name == n.name and n.num_rows == 1:
-                    n.set("X", param.x)
-                    if n.num_cols > 1:
-                        n.set("Y", param.y)
-                    if n.num_cols > 2:
-                        n.set("Z", param.z)
-                    if n.num_cols > 3:
-                        n.set("W", param.w)
+        n = nodes.get(param.name, None)
+        if isinstance(n, bpy.types.ShaderNodeTexImage):
+            texture_path = lookup_texture_file(param.texture_name, texture_folder)
+            if texture_path is not None:
+                img = bpy.data.images.load(str(texture_path), check_existing=True)
+                n.image = img
+
+            if not n.image:
+                # for texture shader parameters with no name
+                if not param.texture_name:
+                    continue
+                # Check for existing texture
+                existing_texture = bpy.data.images.get(param.texture_name, None)
+                texture = bpy.data.images.new(
+                    name=param.texture_name, width=512, height=512) if not existing_texture else existing_texture
+                n.image = texture
+
+            # TODO: we could specify non-color textures in shaders.xml
+            # assign non-color...
+            if (
+                "Bump" in param.name or  # ...to normal maps
+                param.name == "distanceMapSampler" or  # ...to distance maps
+                (filename == "decal_dirt.sps" and param.name == "DiffuseSampler") # ...to shadow maps
+            ):
+                n.image.colorspace_settings.name = "Non-Color"
+
+            preferences = get_addon_preferences(bpy.context)
+            text_name = preferences.use_text_name_as_mat_name
+            if text_name:
+                if param.texture_name and param.name == "DiffuseSampler":
+                    material.name = param.texture_name
+
+            # Assign embedded texture dictionary properties
+            texture = embedded_textures.get(param.texture_name, None)
+            if texture is not None:
+                n.texture_properties.embedded = True
+                try:
+                    format = TextureFormat[texture.format.replace("D3DFMT_", "")]
+                    n.texture_properties.format = format
+                except AttributeError:
+                    logger.warning(f"Failed to set texture format: format '{texture.format}' unknown.")
+
+                try:
+                    usage = TextureUsage[texture.usage]
+                    n.texture_properties.usage = usage
+                except AttributeError:
+                    logger.warning(f"Failed to set texture usage: usage '{texture.usage}' unknown.")
+
+                n.texture_properties.extra_flags = texture.extra_flags
+
+                for prop in dir(n.texture_flags):
+                    for uf in texture.usage_flags:
+                        if uf.lower() == prop:
+                            setattr(
+                                n.texture_flags, prop, True)
+
+            if not n.texture_properties.embedded and not n.image.filepath:
+                # Set external texture name for non-embedded textures
+                n.image.source = "FILE"
+                n.image.filepath = "//" + param.texture_name + ".dds"
+
+        elif isinstance(n, SzShaderNodeParameter):
+            if n.num_rows == 1:
+                n.set("X", param.x)
+                if n.num_cols > 1:
+                    n.set("Y", param.y)
+                if n.num_cols > 2:
+                    n.set("Z", param.z)
+                if n.num_cols > 3:
+                    n.set("W", param.w)
 
     # assign extra detail node image for viewing
     dtl_ext = get_detail_extra_sampler(material)
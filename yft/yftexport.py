@@ -1,29 +1,34 @@
 import bpy
-from typing import Optional, Tuple
+from typing import NamedTuple, Optional, Tuple
 from collections import defaultdict
-from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor
 from mathutils import Matrix, Vector
 from bpy_extras.mesh_utils import mesh_linked_triangles
 from sys import float_info
 import numpy as np
+from numpy.typing import NDArray
 
 from ..ybn.ybnexport import create_composite_xml, get_scale_to_apply_to_bound
-from ..cwxml.bound import Bound, BoundComposite
+from ..cwxml.bound import BoundComposite
 from ..cwxml.fragment import (
     Fragment, PhysicsLOD, Archetype, PhysicsChild, PhysicsGroup, Transform, Physics, BoneTransform, Window,
     GlassWindow, GlassWindows,
 )
 from ..cwxml.drawable import Bone, Drawable, ShaderGroup, VectorShaderParameter, VertexLayoutList
-from ..tools.blenderhelper import get_evaluated_obj, remove_number_suffix, delete_hierarchy, get_child_of_bone
+from ..tools.blenderhelper import get_evaluated_obj, obj_mesh_needs_evaluation, remove_number_suffix, get_child_of_bone
 from ..tools.fragmenthelper import image_to_shattermap
 from ..tools.meshhelper import flip_uvs
-from ..tools.utils import prop_array_to_vector, reshape_mat_4x3, vector_inv, reshape_mat_3x4
+from ..tools.utils import prop_array_to_vector, vector_inv
 from ..sollumz_helper import get_parent_inverse, get_sollumz_materials
 from ..sollumz_properties import BOUND_TYPES, SollumType, MaterialType, LODLevel, VehiclePaintLayer
 from ..sollumz_preferences import get_export_settings
 from ..ybn.ybnexport import has_col_mats, bound_geom_has_mats
-from ..ydr.ydrexport import create_drawable_xml, write_embedded_textures, get_bone_index, create_model_xml, append_model_xml, set_drawable_xml_extents
+from ..ydr.ydrexport import (
+    create_drawable_xml, get_embedded_texture_copies, copy_embedded_textures, get_bone_index, create_model_xml,
+    append_model_xml, set_drawable_xml_extents, get_export_lod_levels,
+)
 from ..ydr.lights import create_xml_lights
+from ..shared.geometry import calculate_composite_inertia
 from .. import logger
 from .properties import (
     LODProperties, FragArchetypeProperties, GroupProperties, PAINT_LAYER_VALUES,
@@ -32,34 +37,92 @@ from .properties import (
 )
 
 
+class FragChildren(NamedTuple):
+    """Objects parented to a fragment, gathered once per export. ``Object.children`` and
+    ``Object.children_recursive`` scan every object in the file on each access."""
+    direct: list[bpy.types.Object]
+    recursive: list[bpy.types.Object]
+    by_parent: dict[bpy.types.Object, list[bpy.types.Object]]
+    by_type: dict[SollumType, list[bpy.types.Object]]
+    bone_by_obj: dict[bpy.types.Object, Optional[bpy.types.Bone]]
+    has_collisions: bool
+    veh_windows: list[bpy.types.Object]
+
+    def children_of(self, obj: bpy.types.Object) -> list[bpy.types.Object]:
+        return self.by_parent.get(obj, [])
+
+    def get_child_of_bone(self, obj: bpy.types.Object) -> Optional[bpy.types.Bone]:
+        """Memoized ``get_child_of_bone``."""
+        if obj not in self.bone_by_obj:
+            self.bone_by_obj[obj] = get_child_of_bone(obj)
+
+        return self.bone_by_obj[obj]
+
+
+def get_frag_children(frag_obj: bpy.types.Object) -> FragChildren:
+    recursive = frag_obj.children_recursive
+    by_parent = defaultdict(list)
+    by_type = defaultdict(list)
+    veh_windows = []
+    for obj in recursive:
+        by_parent[obj.parent].append(obj)
+        by_type[obj.sollum_type].append(obj)
+        if obj.child_properties.is_veh_window:
+            veh_windows.append(obj)
+
+    direct = by_parent.get(frag_obj, [])
+    has_collisions = any(child.sollum_type == SollumType.BOUND_COMPOSITE for child in direct)
+
+    return FragChildren(direct, recursive, dict(by_parent), dict(by_type), {}, has_collisions, veh_windows)
+
+
 def export_yft(frag_obj: bpy.types.Object, filepath: str) -> bool:
     export_settings = get_export_settings()
-    frag_xml = create_fragment_xml(frag_obj, export_settings.apply_transforms)
+    frag_children = get_frag_children(frag_obj)
+    frag_xml = create_fragment_xml(frag_obj, export_settings.apply_transforms, frag_children)
 
     if frag_xml is None:
         return False
 
-    if export_settings.export_non_hi:
-        frag_xml.write_xml(filepath)
-        write_embedded_textures(frag_obj, filepath)
+    exported = True
 
-    if export_settings.export_hi and has_hi_lods(frag_obj):
-        hi_filepath = filepath.replace(".yft.xml", "_hi.yft.xml")
+    # Copy the embedded textures in the background while the XMLs are built and written. Only the file copying
+    # happens in the worker thread, the Blender data access and logging must stay in the main thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        texture_copy_futures = []
 
-        hi_frag_xml = create_hi_frag_xml(frag_obj, frag_xml, export_settings.apply_transforms)
-        hi_frag_xml.write_xml(hi_filepath)
+        if export_settings.export_non_hi:
+            texture_copies = get_embedded_texture_copies(frag_obj, filepath)
+            texture_copy_futures.append(executor.submit(copy_embedded_textures, texture_copies))
+            frag_xml.write_xml(filepath)
 
-        write_embedded_textures(frag_obj, hi_filepath)
-        logger.info(f"Exported Very High LODs to '{hi_filepath}'")
-    elif export_settings.export_hi and not export_settings.export_non_hi:
-        logger.warning(f"Only Very High LODs selected to export but fragment '{frag_obj.name}' does not have Very High"
-                       " LODs. Nothing was exported.")
-        return False
+        if export_settings.export_hi and has_hi_lods(frag_obj, frag_children):
+            hi_filepath = filepath.replace(".yft.xml", "_hi.yft.xml")
+
+            texture_copies = get_embedded_texture_copies(frag_obj, hi_filepath)
+            texture_copy_futures.append(executor.submit(copy_embedded_textures, texture_copies))
 
-    return True
+            hi_frag_xml = create_hi_frag_xml(frag_obj, frag_xml, export_settings.apply_transforms, frag_children)
+            hi_frag_xml.write_xml(hi_filepath)
 
+            logger.info(f"Exported Very High LODs to '{hi_filepath}'")
+        elif export_settings.export_hi and not export_settings.export_non_hi:
+            logger.warning(f"Only Very High LODs selected to export but fragment '{frag_obj.name}' does not have Very High"
+                           " LODs. Nothing was exported.")
+            exported = False
 
-def create_fragment_xml(frag_obj: bpy.types.Object, apply_transforms: bool = False):
+        # Re-raise any exception from the texture copies
+        for future in texture_copy_futures:
+            future.result()
+
+    return exported
+
+
+def create_fragment_xml(
+    frag_obj: bpy.types.Object,
+    apply_transforms: bool = False,
+    frag_children: Optional[FragChildren] = None
+):
     """Create an XML parsable Fragment object. Returns the XML object and the hi XML object (if hi lods are present)."""
     frag_xml = Fragment()
     frag_xml.name = f"pack:/{remove_number_suffix(frag_obj.name)}"
@@ -71,8 +134,11 @@ def create_fragment_xml(frag_obj: bpy.types.Object, apply_transforms: bool = Fal
 
     set_frag_xml_properties(frag_obj, frag_xml)
 
+    if frag_children is None:
+        frag_children = get_frag_children(frag_obj)
+
     materials = get_sollumz_materials(frag_obj)
-    drawable_xml = create_frag_drawable_xml(frag_obj, materials, apply_transforms)
+    drawable_xml = create_frag_drawable_xml(frag_obj, frag_children, materials, apply_transforms)
 
     if drawable_xml is None:
         logger.warning(
@@ -93,9 +159,10 @@ def create_fragment_xml(frag_obj: bpy.types.Object, apply_transforms: bool = Fal
         create_bone_transforms_xml(frag_xml)
 
     # Physics data doesn't do anything if no collisions are present and will cause crashes
-    if frag_has_collisions(frag_obj) and frag_obj.data.bones:
-        create_frag_physics_xml(frag_obj, frag_xml, materials)
-        create_vehicle_windows_xml(frag_obj, frag_xml, materials)
+    if frag_has_collisions(frag_children) and frag_obj.data.bones:
+        create_frag_physics_xml(frag_obj, frag_children, frag_xml, materials)
+        if frag_children.veh_windows:
+            create_vehicle_windows_xml(frag_obj, frag_children, frag_xml, materials)
     else:
         frag_xml.physics = None
 
@@ -106,13 +173,20 @@ def create_fragment_xml(frag_obj: bpy.types.Object, apply_transforms: bool = Fal
     return frag_xml
 
 
-def create_frag_drawable_xml(frag_obj: bpy.types.Object, materials: list[bpy.types.Material], apply_transforms: bool = False):
-    for obj in frag_obj.children:
+def create_frag_drawable_xml(
+    frag_obj: bpy.types.Object,
+    frag_children: FragChildren,
+    materials: list[bpy.types.Material],
+    apply_transforms: bool = False,
+    very_high_only: bool = False
+):
+    for obj in frag_children.direct:
         if obj.sollum_type != SollumType.DRAWABLE:
             continue
 
         drawable_xml = create_drawable_xml(
-            obj, materials=materials, armature_obj=frag_obj, apply_transforms=apply_transforms)
+            obj, materials=materials, armature_obj=frag_obj, apply_transforms=apply_transforms,
+            very_high_only=very_high_only)
         drawable_xml.name = "skel"
 
         return drawable_xml
@@ -120,123 +194,114 @@ def create_frag_drawable_xml(frag_obj: bpy.types.Object, materials: list[bpy.typ
 
 def set_paint_layer_shader_params(materials: list[bpy.types.Material], shader_group: ShaderGroup):
     """Set matDiffuseColor shader params based off of paint layer selection (expects materials to be ordered by shader)"""
+    shaders = shader_group.shaders
     for i, mat in enumerate(materials):
         paint_layer = mat.sollumz_paint_layer
         if paint_layer == VehiclePaintLayer.NOT_PAINTABLE:
             continue
 
-        for param in shader_group.shaders[i].parameters:
-            if not isinstance(param, VectorShaderParameter) or param.name != "matDiffuseColor":
-                continue
-
-            value = PAINT_LAYER_VALUES[paint_layer]
-            param.x, param.y, param.z, param.w = (2, value, value, 0)
-
-
-def create_hi_frag_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, apply_transforms: bool = False):
-    hi_obj = frag_obj.copy()
-    hi_obj.name = f"{remove_number_suffix(hi_obj.name)}_hi"
-    drawable_obj = None
+        # Only the shader of a paintable material is scanned, and only until its matDiffuseColor is found
+        param = next((p for p in shaders[i].parameters
+                      if isinstance(p, VectorShaderParameter) and p.name == "matDiffuseColor"), None)
+        if param is None:
+            continue
 
-    bpy.context.collection.objects.link(hi_obj)
+        value = PAINT_LAYER_VALUES[paint_layer]
+        param.x, param.y, param.z, param.w = (2, value, value, 0)
 
-    for child in frag_obj.children:
-        if child.sollum_type == SollumType.DRAWABLE:
-            drawable_obj = copy_hierarchy(child, hi_obj)
-            drawable_obj.parent = hi_obj
-            break
 
-    if drawable_obj is not None:
-        remove_non_hi_lods(drawable_obj)
+def create_hi_frag_xml(
+    frag_obj: bpy.types.Object,
+    frag_xml: Fragment,
+    apply_transforms: bool = False,
+    frag_children: Optional[FragChildren] = None
+):
+    """Create the _hi Fragment XML object. The drawable and physics children drawables are built from the Very High
+    LODs only, the rest of the fragment is shared with ``frag_xml``."""
+    if frag_children is None:
+        frag_children = get_frag_children(frag_obj)
 
-    materials = get_sollumz_materials(hi_obj)
-    hi_drawable = create_frag_drawable_xml(hi_obj, materials, apply_transforms)
+    materials = get_sollumz_materials(frag_obj, lod_levels=(LODLevel.VERYHIGH,))
+    hi_drawable = create_frag_drawable_xml(frag_obj, frag_children, materials, apply_transforms, very_high_only=True)
 
     hi_frag_xml = Fragment()
-    hi_frag_xml.__dict__ = frag_xml.__dict__.copy()
+    hi_frag_xml.name = frag_xml.name
+    hi_frag_xml.bounding_sphere_center = frag_xml.bounding_sphere_center
+    hi_frag_xml.bounding_sphere_radius = frag_xml.bounding_sphere_radius
+    hi_frag_xml.unknown_b0 = frag_xml.unknown_b0
+    hi_frag_xml.unknown_b8 = frag_xml.unknown_b8
+    hi_frag_xml.unknown_bc = frag_xml.unknown_bc
+    hi_frag_xml.unknown_c0 = frag_xml.unknown_c0
+    hi_frag_xml.unknown_c4 = frag_xml.unknown_c4
+    hi_frag_xml.unknown_cc = frag_xml.unknown_cc
+    hi_frag_xml.gravity_factor = frag_xml.gravity_factor
+    hi_frag_xml.buoyancy_factor = frag_xml.buoyancy_factor
     hi_frag_xml.drawable = hi_drawable
+    hi_frag_xml.bones_transforms = frag_xml.bones_transforms
+    hi_frag_xml.glass_windows = frag_xml.glass_windows
+    hi_frag_xml.lights = frag_xml.lights
     hi_frag_xml.vehicle_glass_windows = None
 
-    if hi_frag_xml.physics is not None:
-        # Physics children drawables are copied over from non-hi to the hi frag. Therefore, they have high, med and low
-        # lods but we need the very high lods in the hi frag XML. Here we remove the existing lods and recreate the
-        # drawables with the very high lods.
-        # NOTE: we are doing a shallow copy, so we are modifying the original physics children here. This is fine
-        # because`frag_xml` is not used after this call during YFT export, but if eventually we need to use it,
-        # we should change to a deep copy.
-        bones = hi_frag_xml.drawable.skeleton.bones
-        child_meshes = get_child_meshes(hi_obj)
-        for child_xml in hi_frag_xml.physics.lod1.children:
-            drawable = child_xml.drawable
-            drawable.drawable_models_high.clear()
-            drawable.drawable_models_med.clear()
-            drawable.drawable_models_low.clear()
-            drawable.drawable_models_vlow.clear()
-
-            bone_tag = child_xml.bone_tag
-            bone_name = None
-            for bone in bones:
-                if bone.tag == bone_tag:
-                    bone_name = bone.name
-                    break
-
-            mesh_objs = None
-            if bone_name in child_meshes:
-                mesh_objs = child_meshes[bone_name]
-
-            create_phys_child_drawable(child_xml, materials, mesh_objs)
-
-    delete_hierarchy(hi_obj)
+    if frag_xml.physics is None:
+        hi_frag_xml.physics = None
+    else:
+        hi_frag_xml.physics = create_hi_phys_xml(frag_xml, frag_children, materials)
 
     return hi_frag_xml
 
 
-def copy_hierarchy(obj: bpy.types.Object, armature_obj: bpy.types.Object):
-    obj_copy = obj.copy()
-
-    bpy.context.collection.objects.link(obj_copy)
-
-    for constraint in obj_copy.constraints:
-        if constraint.type != "ARMATURE":
-            continue
-
-        for constraint_target in constraint.targets:
-            constraint_target.target = armature_obj
-
-    for modifier in obj_copy.modifiers:
-        if modifier.type != "ARMATURE":
-            continue
-
-        modifier.object = armature_obj
-
-    for child in obj.children:
-        child_copy = copy_hierarchy(child, armature_obj)
-        child_copy.parent = obj_copy
-
-    return obj_copy
-
-
-def remove_non_hi_lods(drawable_obj: bpy.types.Object):
-    for model_obj in drawable_obj.children:
-        if model_obj.sollum_type != SollumType.DRAWABLE_MODEL:
-            continue
-
-        lods = model_obj.sz_lods
-        very_high_lod = lods.get_lod(LODLevel.VERYHIGH)
-
-        if very_high_lod.mesh is None:
-            bpy.data.objects.remove(model_obj)
-            continue
-
-        lods.get_lod(LODLevel.HIGH).mesh = very_high_lod.mesh
-        lods.active_lod_level = LODLevel.HIGH
-
-        for lod_level in LODLevel:
-            if lod_level == LODLevel.HIGH:
-                continue
-            lod = lods.get_lod(lod_level)
-            if lod.mesh is not None:
-                lod.mesh = None
+def create_hi_phys_xml(frag_xml: Fragment, frag_children: FragChildren, materials: list[bpy.types.Material]) -> Physics:
+    """Create the physics of the _hi Fragment. Everything is shared with the physics of ``frag_xml`` except for the
+    LOD1 children, which get new drawables built from the Very High LODs."""
+    phys_xml = frag_xml.physics
+    lod_xml = phys_xml.lod1
+
+    hi_lod_xml = PhysicsLOD(lod_xml.tag_name)
+    hi_lod_xml.unknown_14 = lod_xml.unknown_14
+    hi_lod_xml.unknown_18 = lod_xml.unknown_18
+    hi_lod_xml.unknown_1c = lod_xml.unknown_1c
+    hi_lod_xml.position_offset = lod_xml.position_offset
+    hi_lod_xml.unknown_40 = lod_xml.unknown_40
+    hi_lod_xml.unknown_50 = lod_xml.unknown_50
+    hi_lod_xml.damping_linear_c = lod_xml.damping_linear_c
+    hi_lod_xml.damping_linear_v = lod_xml.damping_linear_v
+    hi_lod_xml.damping_linear_v2 = lod_xml.damping_linear_v2
+    hi_lod_xml.damping_angular_c = lod_xml.damping_angular_c
+    hi_lod_xml.damping_angular_v = lod_xml.damping_angular_v
+    hi_lod_xml.damping_angular_v2 = lod_xml.damping_angular_v2
+    hi_lod_xml.archetype = lod_xml.archetype
+    hi_lod_xml.archetype2 = lod_xml.archetype2
+    hi_lod_xml.transforms = lod_xml.transforms
+    hi_lod_xml.groups = lod_xml.groups
+
+    bone_name_by_tag = {}
+    for bone in frag_xml.drawable.skeleton.bones:
+        # setdefault to keep the first bone if multiple bones have the same tag
+        bone_name_by_tag.setdefault(bone.tag, bone.name)
+    child_meshes = get_child_meshes(frag_children)
+
+    hi_children = []
+    for child_xml in lod_xml.children:
+        hi_child_xml = PhysicsChild()
+        hi_child_xml.group_index = child_xml.group_index
+        hi_child_xml.bone_tag = child_xml.bone_tag
+        hi_child_xml.pristine_mass = child_xml.pristine_mass
+        hi_child_xml.damaged_mass = child_xml.damaged_mass
+        hi_child_xml.unk_float = child_xml.unk_float
+        hi_child_xml.unk_vec = child_xml.unk_vec
+        hi_child_xml.inertia_tensor = child_xml.inertia_tensor
+
+        bone_name = bone_name_by_tag.get(child_xml.bone_tag, None)
+        create_phys_child_drawable(hi_child_xml, materials, child_meshes.get(bone_name, None), very_high_only=True)
+        hi_children.append(hi_child_xml)
+    hi_lod_xml.children = hi_children
+
+    hi_phys_xml = Physics()
+    hi_phys_xml.lod1 = hi_lod_xml
+    hi_phys_xml.lod2 = phys_xml.lod2
+    hi_phys_xml.lod3 = phys_xml.lod3
+
+    return hi_phys_xml
 
 
 def copy_phys_xml(phys_xml: Physics, lod_props: LODProperties):
@@ -255,11 +320,12 @@ def copy_phys_xml(phys_xml: Physics, lod_props: LODProperties):
     return new_phys_xml
 
 
-def has_hi_lods(frag_obj: bpy.types.Object):
-    for child in frag_obj.children_recursive:
-        if child.sollum_type != SollumType.DRAWABLE_MODEL and not child.sollumz_is_physics_child_mesh:
-            continue
+def has_hi_lods(frag_obj: bpy.types.Object, frag_children: Optional[FragChildren] = None):
+    if frag_children is None:
+        frag_children = get_frag_children(frag_obj)
 
+    # Physics children meshes are drawable models too
+    for child in frag_children.by_type.get(SollumType.DRAWABLE_MODEL, ()):
         very_high_lod = child.sz_lods.get_lod(LODLevel.VERYHIGH)
         if very_high_lod.mesh is not None:
             return True
@@ -268,63 +334,51 @@ def has_hi_lods(frag_obj: bpy.types.Object):
 
 
 def sort_cols_and_children(lod_xml: PhysicsLOD):
-    children_by_group: dict[int, list[int]] = defaultdict(list)
-
     bounds = lod_xml.archetype.bounds.children
     children = lod_xml.children
 
     if not bounds or not children:
         return
 
-    for i, child in enumerate(children):
-        children_by_group[child.group_index].append(i)
+    # Sort by group index, stable so children keep their order within each group
+    sorted_indices = sorted(range(len(children)), key=lambda i: children[i].group_index)
 
-    children_by_group = dict(sorted(children_by_group.items()))
-
-    # Map old indices to new ones
-    indices: dict[int, int] = {}
-    sorted_children: list[PhysicsChild] = []
-
-    for group_index, children_indices in children_by_group.items():
-        for child_index in children_indices:
-            new_child_index = len(sorted_children)
-            indices[child_index] = new_child_index
-
-            sorted_children.append(children[child_index])
-
-    lod_xml.children = sorted_children
+    lod_xml.children = [children[i] for i in sorted_indices]
     # Apply sorting to collisions
-    sorted_collisions: list[Bound] = [None] * len(indices)
+    lod_xml.archetype.bounds.children = [bounds[i] for i in sorted_indices]
 
-    for old_index, new_index in indices.items():
-        sorted_collisions[new_index] = bounds[old_index]
 
-    lod_xml.archetype.bounds.children = sorted_collisions
+def frag_has_collisions(frag_children: FragChildren):
+    return frag_children.has_collisions
 
 
-def frag_has_collisions(frag_obj: bpy.types.Object):
-    return any(child.sollum_type == SollumType.BOUND_COMPOSITE for child in frag_obj.children)
-
-
-def create_frag_physics_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, materials: list[bpy.types.Material]):
+def create_frag_physics_xml(
+    frag_obj: bpy.types.Object,
+    frag_children: FragChildren,
+    frag_xml: Fragment,
+    materials: list[bpy.types.Material]
+):
     lod_props: LODProperties = frag_obj.fragment_properties.lod_properties
     drawable_xml = frag_xml.drawable
 
     lod_xml = create_phys_lod_xml(frag_xml.physics, lod_props)
     arch_xml = create_archetype_xml(lod_xml, frag_obj)
     col_obj_to_bound_index = dict()
-    create_collision_xml(frag_obj, arch_xml, col_obj_to_bound_index)
+    create_collision_xml(frag_children, arch_xml, col_obj_to_bound_index)
 
-    create_phys_xml_groups(frag_obj, lod_xml, frag_xml.glass_windows, materials)
-    create_phys_child_xmls(frag_obj, lod_xml, drawable_xml.skeleton.bones, materials, col_obj_to_bound_index)
+    create_phys_xml_groups(frag_obj, frag_children, lod_xml, frag_xml.glass_windows, materials)
+    create_phys_child_xmls(
+        frag_obj, frag_children, lod_xml, drawable_xml.skeleton.bones, materials, col_obj_to_bound_index
+    )
 
     calculate_group_masses(lod_xml)
     calculate_child_drawable_matrices(frag_xml)
 
     sort_cols_and_children(lod_xml)
 
-    calculate_physics_lod_transforms(frag_xml)
-    calculate_archetype_mass_inertia(lod_xml)
+    children_bounds = get_physics_children_bounds(lod_xml)
+    calculate_physics_lod_transforms(frag_xml, children_bounds)
+    calculate_archetype_mass_inertia(lod_xml, children_bounds)
     calculate_physics_lod_inertia_limits(lod_xml)
 
 
@@ -339,8 +393,8 @@ def create_phys_lod_xml(phys_xml: Physics, lod_props: LODProperties):
 def calculate_physics_lod_inertia_limits(lod_xml: PhysicsLOD):
     """Calculates the physics LOD smallest and largest angular inertia from its children."""
     phys_children = lod_xml.children
-    inertia_values = [value for c in phys_children for value in c.inertia_tensor.xyz]
-    largest_inertia = max(inertia_values)
+    inertia_values = np.array([c.inertia_tensor.xyz for c in phys_children], dtype=np.float64)
+    largest_inertia = float(inertia_values.max())
     smallest_inertia = largest_inertia / 10000.0  # game assets always have same value as largest divided by 10000
 
     # unknown_14 = smallest angular inertia
@@ -358,19 +412,49 @@ def create_archetype_xml(lod_xml: PhysicsLOD, frag_obj: bpy.types.Object):
     return lod_xml.archetype
 
 
-def calculate_archetype_mass_inertia(lod_xml: PhysicsLOD):
+class PhysicsChildrenBounds(NamedTuple):
+    """Collision bound data of the physics children, as arrays indexed by physics child index."""
+    has_bound: NDArray[np.bool_]
+    # Composite transforms as stored in the XML (transposed). Identity if the child has no bound
+    transforms: NDArray[np.float64]
+    # Bound sphere centers in fragment space. Zero if the child has no bound
+    centers_of_gravity: NDArray[np.float64]
+
+
+def get_physics_children_bounds(lod_xml: PhysicsLOD) -> PhysicsChildrenBounds:
+    """Get the bound transforms and centers of gravity of each physics child. Expects collisions to be sorted in
+    the same order as the physics children."""
+    num_children = len(lod_xml.children)
+    bounds = lod_xml.archetype.bounds.children[:num_children]
+    has_bound = np.array([bound is not None for bound in bounds], dtype=bool)
+    transforms = np.array(
+        [bound.composite_transform if bound is not None else Matrix.Identity(4) for bound in bounds],
+        dtype=np.float64
+    ).reshape((num_children, 4, 4))
+    sphere_centers = np.array(
+        [bound.sphere_center if bound is not None else (0.0, 0.0, 0.0) for bound in bounds],
+        dtype=np.float64
+    ).reshape((num_children, 3))
+
+    # sphere_center is the center of gravity. composite_transform is stored transposed, so transform it as a row vector
+    centers = np.einsum("nj,nji->ni", sphere_centers, transforms[:, :3, :3]) + transforms[:, 3, :3]
+    centers[~has_bound] = 0.0
+
+    return PhysicsChildrenBounds(has_bound, transforms, centers)
+
+
+def calculate_archetype_mass_inertia(lod_xml: PhysicsLOD, children_bounds: Optional[PhysicsChildrenBounds] = None):
     """Set archetype mass and inertia based on children mass and bounds. Expects physics children and collisions to
     exist, and the physics LOD root CG to have already been calculted.
     """
+    if children_bounds is None:
+        children_bounds = get_physics_children_bounds(lod_xml)
 
-    from ..shared.geometry import calculate_composite_inertia
     phys_children = lod_xml.children
-    bounds = lod_xml.archetype.bounds.children
     masses = [child_xml.pristine_mass for child_xml in phys_children]
     inertias = [child_xml.inertia_tensor.xyz for child_xml in phys_children]
-    cgs = [bound_xml.composite_transform.transposed() @ bound_xml.sphere_center for bound_xml in bounds]
     mass = sum(masses)
-    inertia = calculate_composite_inertia(lod_xml.position_offset, cgs, masses, inertias)
+    inertia = calculate_composite_inertia(lod_xml.position_offset, children_bounds.centers_of_gravity, masses, inertias)
 
     arch_xml = lod_xml.archetype
     arch_xml.mass = mass
@@ -380,11 +464,11 @@ def calculate_archetype_mass_inertia(lod_xml: PhysicsLOD):
 
 
 def create_collision_xml(
-    frag_obj: bpy.types.Object,
+    frag_children: FragChildren,
     arch_xml: Archetype,
     col_obj_to_bound_index: dict[bpy.types.Object, int] = None
 ) -> BoundComposite:
-    for child in frag_obj.children:
+    for child in frag_children.direct:
         if child.sollum_type != SollumType.BOUND_COMPOSITE:
             continue
 
@@ -400,40 +484,44 @@ def create_collision_xml(
 
 def create_phys_xml_groups(
     frag_obj: bpy.types.Object,
+    frag_children: FragChildren,
     lod_xml: PhysicsLOD,
     glass_windows_xml: GlassWindows,
     materials: list[bpy.types.Material]
 ):
     group_ind_by_name: dict[str, int] = {}
     groups_by_bone: dict[int, list[PhysicsGroup]] = defaultdict(list)
+    bones_with_collision = get_bones_with_collision(frag_children)
+    bones = frag_obj.data.bones
+    glass_window_objs_by_bone = None
 
-    for bone in frag_obj.data.bones:
+    for bone_index, bone in enumerate(bones):
         if not bone.sollumz_use_physics:
             continue
 
-        if not does_bone_have_collision(bone.name, frag_obj):
+        if bone.name not in bones_with_collision:
             logger.warning(
                 f"Bone '{bone.name}' has physics enabled, but no associated collision! A collision must be linked to the bone for physics to work.")
             continue
 
         group_xml = PhysicsGroup()
         group_xml.name = bone.name
-        bone_index = get_bone_index(frag_obj.data, bone)
 
         groups_by_bone[bone_index].append(group_xml)
         set_group_xml_properties(bone.group_properties, group_xml)
 
         if bone.group_properties.flags[GroupFlagBit.USE_GLASS_WINDOW]:
-            add_frag_glass_window_xml(frag_obj, bone, materials, group_xml, glass_windows_xml)
+            if glass_window_objs_by_bone is None:
+                glass_window_objs_by_bone = get_frag_glass_window_objs_by_bone(frag_children)
+
+            add_frag_glass_window_xml(glass_window_objs_by_bone, bone, materials, group_xml, glass_windows_xml)
 
     # Sort by bone index
     groups_by_bone = dict(sorted(groups_by_bone.items()))
 
     for groups in groups_by_bone.values():
         for group_xml in groups:
-            i = len(group_ind_by_name)
-
-            group_ind_by_name[group_xml.name] = i
+            group_ind_by_name[group_xml.name] = len(group_ind_by_name)
 
     def get_group_parent_index(group_bone: bpy.types.Bone) -> int:
         """Returns parent group index or 255 if there is no parent."""
@@ -448,39 +536,41 @@ def create_phys_xml_groups(
         return group_ind_by_name[parent_bone.name]
 
     # Set group parent indices
+    lod_groups = lod_xml.groups
     for bone_index, groups in groups_by_bone.items():
-        parent_index = get_group_parent_index(frag_obj.data.bones[bone_index])
+        parent_index = get_group_parent_index(bones[bone_index])
 
         for group_xml in groups:
             group_xml.parent_index = parent_index
 
-            group_ind_by_name[group_xml.name] = len(lod_xml.groups)
-
-            lod_xml.groups.append(group_xml)
+            group_ind_by_name[group_xml.name] = len(lod_groups)
 
-    return lod_xml.groups
+            lod_groups.append(group_xml)
 
+    return lod_groups
 
-def does_bone_have_collision(bone_name: str, frag_obj: bpy.types.Object):
-    col_objs = [
-        obj for obj in frag_obj.children_recursive if obj.sollum_type in BOUND_TYPES]
 
-    for obj in col_objs:
-        bone = get_child_of_bone(obj)
+def get_bones_with_collision(frag_children: FragChildren) -> set[str]:
+    """Get the names of all bones that have a collision linked to them."""
+    bone_names = set()
+    for bound_type in BOUND_TYPES:
+        for obj in frag_children.by_type.get(bound_type, ()):
+            bone = frag_children.get_child_of_bone(obj)
 
-        if bone is not None and bone.name == bone_name:
-            return True
+            if bone is not None:
+                bone_names.add(bone.name)
 
-    return False
+    return bone_names
 
 
 def calculate_group_masses(lod_xml: PhysicsLOD):
     """Calculate the mass of all groups in ``lod_xml`` based on child masses. Expects physics children to exist."""
+    groups = lod_xml.groups
     for child in lod_xml.children:
-        lod_xml.groups[child.group_index].mass += child.pristine_mass
+        groups[child.group_index].mass += child.pristine_mass
 
 
-def calculate_physics_lod_transforms(frag_xml: Fragment):
+def calculate_physics_lod_transforms(frag_xml: Fragment, children_bounds: Optional[PhysicsChildrenBounds] = None):
     """Calculate ``frag_xml.physics.lod1.transforms``. A transformation matrix per physics child that represents
     the offset from the child collision bound to its link center of gravity (aka "link attachment"). A link is
     formed by physics groups that act as a rigid body together, a group with a joint creates a new link.
@@ -488,14 +578,18 @@ def calculate_physics_lod_transforms(frag_xml: Fragment):
     """
 
     lod_xml = frag_xml.physics.lod1
-    bones_xml = frag_xml.drawable.skeleton.bones
-    rotation_limits = frag_xml.drawable.joints.rotation_limits
-    translation_limits = frag_xml.drawable.joints.translation_limits
+    if children_bounds is None:
+        children_bounds = get_physics_children_bounds(lod_xml)
 
-    children_by_group: dict[PhysicsGroup, list[tuple[int, PhysicsChild]]] = defaultdict(list)
-    for child_index, child in enumerate(lod_xml.children):
-        group = lod_xml.groups[child.group_index]
-        children_by_group[group].append((child_index, child))
+    bone_by_tag: dict[int, Bone] = {}
+    for bone in frag_xml.drawable.skeleton.bones:
+        bone_by_tag.setdefault(bone.tag, bone)
+    rotation_limit_bone_ids = {rl.bone_id for rl in frag_xml.drawable.joints.rotation_limits}
+    translation_limit_bone_ids = {tl.bone_id for tl in frag_xml.drawable.joints.translation_limits}
+
+    first_child_by_group: dict[int, PhysicsChild] = {}
+    for child in lod_xml.children:
+        first_child_by_group.setdefault(child.group_index, child)
 
     # Array of links (i.e. array of arrays of groups)
     links = [[]]  # the root link is at index 0
@@ -506,11 +600,11 @@ def calculate_physics_lod_transforms(frag_xml: Fragment):
         link_index = 0  # by default add to root link
 
         if group.parent_index != 255:
-            _, first_child = children_by_group[group][0]
-            bone = next(b for b in bones_xml if b.tag == first_child.bone_tag)
+            first_child = first_child_by_group[group_index]
+            bone = bone_by_tag[first_child.bone_tag]
             creates_new_link = (
-                ("LimitRotation" in bone.flags and any(rl.bone_id == bone.tag for rl in rotation_limits)) or
-                ("LimitTranslation" in bone.flags and any(tl.bone_id == bone.tag for tl in translation_limits))
+                ("LimitRotation" in bone.flags and bone.tag in rotation_limit_bone_ids) or
+                ("LimitTranslation" in bone.flags and bone.tag in translation_limit_bone_ids)
             )
             if creates_new_link:
                 # There is a joint, create a new link
@@ -525,50 +619,44 @@ def calculate_physics_lod_transforms(frag_xml: Fragment):
 
     # Calculate center of gravity of each link. This is the weighted mean of the center of gravity of all physics
     # children that form the link.
-    links_center_of_gravity = [Vector((0.0, 0.0, 0.0)) for _ in range(len(links))]
-    for link_index, groups in enumerate(links):
-        link_total_mass = 0.0
-        for group_index, group in enumerate(groups):
-            for child_index_rel, (child_index, child) in enumerate(children_by_group[group]):
-                bound = lod_xml.archetype.bounds.children[child_index]
-                if bound is not None:
-                    # sphere_center is the center of gravity
-                    center = bound.composite_transform.transposed() @ bound.sphere_center
-                else:
-                    center = Vector((0.0, 0.0, 0.0))
-
-                child_mass = child.pristine_mass
-                links_center_of_gravity[link_index] += center * child_mass
-                link_total_mass += child_mass
-
-        links_center_of_gravity[link_index] /= link_total_mass
+    has_bound, composite_transforms, centers = children_bounds
+    masses = np.array([child.pristine_mass for child in lod_xml.children], dtype=np.float64)
+    child_group_indices = np.array([child.group_index for child in lod_xml.children], dtype=np.intp)
+    child_link_indices = np.array(link_index_by_group, dtype=np.intp)[child_group_indices]
+
+    links_center_of_gravity = np.zeros((len(links), 3), dtype=np.float64)
+    np.add.at(links_center_of_gravity, child_link_indices, centers * masses[:, None])
+    links_total_mass = np.bincount(child_link_indices, weights=masses, minlength=len(links))
+    for link_index in np.flatnonzero(links_total_mass <= 0.0):
+        group_names = ", ".join(f"'{group.name}'" for group in links[link_index])
+        raise ValueError(
+            f"Cannot calculate the center of gravity of the physics link formed by groups {group_names}, "
+            "its children have no mass!")
+    links_center_of_gravity /= links_total_mass[:, None]
 
     # add the user-defined unbroken CG offset to the root CG offset
     links_center_of_gravity[0] += lod_xml.unknown_50
 
-    lod_xml.position_offset = links_center_of_gravity[0]  # aka "root CG offset"
+    lod_xml.position_offset = Vector(links_center_of_gravity[0])  # aka "root CG offset"
     lod_xml.unknown_40 = lod_xml.position_offset  # aka "original root CG offset", same as root CG offset in all game .yfts
 
-    # Calculate child transforms (aka "link attachments", offset from bound to link CG)
-    for child_index, child in enumerate(lod_xml.children):
-        # print(f"#{child_index} ({child.bone_tag}) link_index={link_index_by_group[child.group_index]}")
-        link_center = links_center_of_gravity[link_index_by_group[child.group_index]]
-        bound = lod_xml.archetype.bounds.children[child_index]
-        if bound is not None:
-            offset = Matrix.Translation(-link_center) @ bound.composite_transform.transposed()
-            offset.transpose()
-        else:
-            offset = Matrix.Identity(4)
+    # Calculate child transforms (aka "link attachments", offset from bound to link CG). This is the transposed
+    # composite transform translated by the link center, i.e. (Translation(-link_center) @ transform.T).T
+    offsets = composite_transforms.copy()
+    offsets[:, :, :3] -= composite_transforms[:, :, 3:4] * links_center_of_gravity[child_link_indices][:, None, :]
+    offsets[~has_bound] = np.identity(4)
 
-        # It is a 3x4 matrix, so zero out the 4th column to be consistent with original matrices
-        # (doesn't really matter but helps with equality checks in our tests)
-        offset.col[3].zero()
+    # It is a 3x4 matrix, so zero out the 4th column to be consistent with original matrices
+    # (doesn't really matter but helps with equality checks in our tests)
+    offsets[:, :, 3] = 0.0
 
-        lod_xml.transforms.append(Transform("Item", offset))
+    for offset in offsets:
+        lod_xml.transforms.append(Transform("Item", Matrix(offset)))
 
 
 def create_phys_child_xmls(
     frag_obj: bpy.types.Object,
+    frag_children: FragChildren,
     lod_xml: PhysicsLOD,
     bones_xml: list[Bone],
     materials: list[bpy.types.Material],
@@ -579,25 +667,33 @@ def create_phys_child_xmls(
     Additionally, makes sure that ``lod_xml.archetype.bounds.children`` order matches ``lod_xml.children`` order so
     the same indices can be used with both collections.
     """
-    child_meshes = get_child_meshes(frag_obj)
-    child_cols = get_child_cols(frag_obj)
+    child_meshes = get_child_meshes(frag_children)
+    child_cols = get_child_cols(frag_children)
+    group_index_by_name: dict[str, int] = {}
+    for i, group in enumerate(lod_xml.groups):
+        group_index_by_name.setdefault(group.name, i)
 
-    bound_index_to_child_index = []
+    bones = frag_obj.data.bones
+    children = lod_xml.children
+    archetype = lod_xml.archetype
+
+    # Bound index of each physics child, in physics children order
+    child_bound_indices = []
     for bone_name, objs in child_cols.items():
+        bone_index = bones.find(bone_name)
+        if bone_index == -1:
+            bone_index = 0
+
         for obj in objs:
-            child_index = len(lod_xml.children)
             bound_index = col_obj_to_bound_index[obj]
-            bound_index_to_child_index.append((bound_index, child_index))
-
-            bone: bpy.types.Bone = frag_obj.data.bones.get(bone_name)
-            bone_index = get_bone_index(frag_obj.data, bone) or 0
+            child_bound_indices.append(bound_index)
 
             child_xml = PhysicsChild()
-            child_xml.group_index = get_bone_group_index(lod_xml, bone_name)
+            child_xml.group_index = group_index_by_name.get(bone_name, -1)
             child_xml.pristine_mass = obj.child_properties.mass
             child_xml.damaged_mass = child_xml.pristine_mass
             child_xml.bone_tag = bones_xml[bone_index].tag
-            child_xml.inertia_tensor = get_child_inertia(lod_xml.archetype, child_xml, bound_index)
+            child_xml.inertia_tensor = get_child_inertia(archetype, child_xml, bound_index)
 
             mesh_objs = None
             if bone_name in child_meshes:
@@ -605,14 +701,13 @@ def create_phys_child_xmls(
 
             create_phys_child_drawable(child_xml, materials, mesh_objs)
 
-            lod_xml.children.append(child_xml)
+            children.append(child_xml)
 
-    # reorder bounds children based on physics children order
-    bounds_children = lod_xml.archetype.bounds.children
-    new_bounds_children = [None] * len(lod_xml.archetype.bounds.children)
-    for bound_index, child_index in bound_index_to_child_index:
-        new_bounds_children[child_index] = bounds_children[bound_index]
-    lod_xml.archetype.bounds.children = new_bounds_children
+    # reorder bounds children based on physics children order, bounds not used by any child are left as None
+    bounds_children = archetype.bounds.children
+    new_bounds_children = [bounds_children[bound_index] for bound_index in child_bound_indices]
+    new_bounds_children.extend([None] * (len(bounds_children) - len(new_bounds_children)))
+    archetype.bounds.children = new_bounds_children
 
 
 def get_child_inertia(arch_xml: Archetype, child_xml: PhysicsChild, bound_index: int):
@@ -624,22 +719,22 @@ def get_child_inertia(arch_xml: Archetype, child_xml: PhysicsChild, bound_index:
     return Vector((inertia.x, inertia.y, inertia.z, bound_xml.volume * child_xml.pristine_mass))
 
 
-def get_child_cols(frag_obj: bpy.types.Object):
+def get_child_cols(frag_children: FragChildren):
     """Get collisions that are linked to a child. Returns a dict mapping each collision to a bone name."""
     child_cols_by_bone: dict[str, list[bpy.types.Object]] = defaultdict(list)
 
-    for composite_obj in frag_obj.children:
+    for composite_obj in frag_children.direct:
         if composite_obj.sollum_type != SollumType.BOUND_COMPOSITE:
             continue
 
-        for bound_obj in composite_obj.children:
+        for bound_obj in frag_children.children_of(composite_obj):
             if not bound_obj.sollum_type in BOUND_TYPES:
                 continue
 
             if (bound_obj.type == "MESH" and not has_col_mats(bound_obj)) or (bound_obj.type == "EMPTY" and not bound_geom_has_mats(bound_obj)):
                 continue
 
-            bone = get_child_of_bone(bound_obj)
+            bone = frag_children.get_child_of_bone(bound_obj)
 
             if bone is None or not bone.sollumz_use_physics:
                 continue
@@ -649,19 +744,19 @@ def get_child_cols(frag_obj: bpy.types.Object):
     return child_cols_by_bone
 
 
-def get_child_meshes(frag_obj: bpy.types.Object):
+def get_child_meshes(frag_children: FragChildren):
     """Get meshes that are linked to a child. Returns a dict mapping child meshes to bone name."""
     child_meshes_by_bone: dict[str, list[bpy.types.Object]] = defaultdict(list)
 
-    for drawable_obj in frag_obj.children:
+    for drawable_obj in frag_children.direct:
         if drawable_obj.sollum_type != SollumType.DRAWABLE:
             continue
 
-        for model_obj in drawable_obj.children:
+        for model_obj in frag_children.children_of(drawable_obj):
             if model_obj.sollum_type != SollumType.DRAWABLE_MODEL or not model_obj.sollumz_is_physics_child_mesh:
                 continue
 
-            bone = get_child_of_bone(model_obj)
+            bone = frag_children.get_child_of_bone(model_obj)
 
             if bone is None or not bone.sollumz_use_physics:
                 continue
@@ -671,34 +766,27 @@ def get_child_meshes(frag_obj: bpy.types.Object):
     return child_meshes_by_bone
 
 
-def get_bone_group_index(lod_xml: PhysicsLOD, bone_name: str):
-    """Get index of group named ``bone_name`` (expects groups to have already been created in ``lod_xml``)."""
-    for i, group in enumerate(lod_xml.groups):
-        if group.name == bone_name:
-            return i
-
-    return -1
-
-
 def create_child_mat_arrays(children: list[PhysicsChild]):
     """Create the matrix arrays for each child. This appears to be in the first child of multiple children that
     share the same group. Each matrix in the array is just the matrix for each child in that group."""
-    group_inds = set(child.group_index for child in children)
-
-    for i in group_inds:
-        group_children = [
-            child for child in children if child.group_index == i]
+    children_by_group: dict[int, list[PhysicsChild]] = defaultdict(list)
+    for child in children:
+        children_by_group[child.group_index].append(child)
 
+    for group_children in children_by_group.values():
         if len(group_children) <= 1:
             continue
 
         first = group_children[0]
-
-        for child in group_children[1:]:
-            first.drawable.matrices.append(child.drawable.matrix)
+        first.drawable.matrices.extend(child.drawable.matrix for child in group_children[1:])
 
 
-def create_phys_child_drawable(child_xml: PhysicsChild, materials: list[bpy.types.Object], mesh_objs: Optional[list[bpy.types.Object]] = None):
+def create_phys_child_drawable(
+    child_xml: PhysicsChild,
+    materials: list[bpy.types.Object],
+    mesh_objs: Optional[list[bpy.types.Object]] = None,
+    very_high_only: bool = False
+):
     drawable_xml = child_xml.drawable
     drawable_xml.shader_group = None
     drawable_xml.skeleton = None
@@ -707,40 +795,43 @@ def create_phys_child_drawable(child_xml: PhysicsChild, materials: list[bpy.type
     if not mesh_objs:
         return drawable_xml
 
+    lod_levels = get_export_lod_levels(very_high_only)
+
     for obj in mesh_objs:
         scale = get_scale_to_apply_to_bound(obj)
         transforms_to_apply = Matrix.Diagonal(scale).to_4x4()
 
         lods = obj.sz_lods
-        for lod_level in LODLevel:
-            if lod_level == LODLevel.VERYHIGH:
-                continue
+        for lod_level, xml_lod_level in lod_levels:
             lod_mesh = lods.get_lod(lod_level).mesh
             if lod_mesh is None:
                 continue
 
             model_xml = create_model_xml(obj, lod_level, materials, transforms_to_apply=transforms_to_apply)
             model_xml.bone_index = 0
-            append_model_xml(drawable_xml, model_xml, lod_level)
+            append_model_xml(drawable_xml, model_xml, xml_lod_level)
 
     set_drawable_xml_extents(drawable_xml)
 
     return drawable_xml
 
 
-def create_vehicle_windows_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, materials: list[bpy.types.Material]):
+def create_vehicle_windows_xml(
+    frag_obj: bpy.types.Object,
+    frag_children: FragChildren,
+    frag_xml: Fragment,
+    materials: list[bpy.types.Material]
+):
     """Create all the vehicle windows for ``frag_xml``. Must be ran after the drawable and physics children have been created."""
     child_id_by_bone_tag: dict[str, int] = {
         c.bone_tag: i for i, c in enumerate(frag_xml.physics.lod1.children)}
     mat_ind_by_name: dict[str, int] = {
         mat.name: i for i, mat in enumerate(materials)}
     bones = frag_xml.drawable.skeleton.bones
+    geometry_index_by_shader = get_window_geometry_index_by_shader(frag_xml.drawable)
 
-    for obj in frag_obj.children_recursive:
-        if not obj.child_properties.is_veh_window:
-            continue
-
-        bone = get_child_of_bone(obj)
+    for obj in frag_children.veh_windows:
+        bone = frag_children.get_child_of_bone(obj)
 
         if bone is None or not bone.sollumz_use_physics:
             logger.warning(
@@ -775,8 +866,7 @@ def create_vehicle_windows_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, m
         create_window_shattermap(obj, window_xml)
 
         shader_index = mat_ind_by_name[window_mat.name]
-        window_xml.unk_ushort_1 = get_window_geometry_index(
-            frag_xml.drawable, shader_index)
+        window_xml.unk_ushort_1 = geometry_index_by_shader.get(shader_index, 0)
 
         frag_xml.vehicle_glass_windows.append(window_xml)
 
@@ -807,21 +897,27 @@ def set_veh_window_xml_properties(window_xml: Window, window_obj: bpy.types.Obje
 def calculate_shattermap_projection(obj: bpy.types.Object, img: bpy.types.Image):
     mesh = obj.data
 
-    v1 = Vector()
-    v2 = Vector()
-    v3 = Vector()
+    num_loops = len(mesh.loops)
+    uvs = np.empty((num_loops, 2), dtype=np.float32)
+    mesh.uv_layers[0].data.foreach_get("uv", uvs.ravel())
+    loop_vert_indices = np.empty(num_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vert_indices)
 
-    # Get three corner vectors
-    for loop in mesh.loops:
-        uv = mesh.uv_layers[0].data[loop.index].uv
-        vert_pos = mesh.vertices[loop.vertex_index].co
+    vert_positions = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    mesh.vertices.foreach_get("co", vert_positions.ravel())
 
-        if uv.x == 0 and uv.y == 1:
-            v1 = vert_pos
-        elif uv.x == 1 and uv.y == 1:
-            v2 = vert_pos
-        elif uv.x == 0 and uv.y == 0:
-            v3 = vert_pos
+    def _get_corner_vert_pos(corner_uv: tuple[float, float]) -> NDArray[np.float64]:
+        loop_indices = np.flatnonzero((uvs == corner_uv).all(axis=1))
+        if len(loop_indices) == 0:
+            return np.zeros(3)
+
+        # Last loop with the corner UV wins
+        return vert_positions[loop_vert_indices[loop_indices[-1]]].astype(np.float64)
+
+    # Get three corner vectors
+    v1 = _get_corner_vert_pos((0.0, 1.0))
+    v2 = _get_corner_vert_pos((1.0, 1.0))
+    v3 = _get_corner_vert_pos((0.0, 0.0))
 
     resx = img.size[0]
     resy = img.size[1]
@@ -829,25 +925,26 @@ def calculate_shattermap_projection(obj: bpy.types.Object, img: bpy.types.Image)
 
     edge1 = (v2 - v1) / resx
     edge2 = (v3 - v1) / resy
-    edge3 = edge1.normalized().cross(edge2.normalized()) * thickness
+    edges = np.array((edge1, edge2))
+    edges_len = np.linalg.norm(edges, axis=1, keepdims=True)
+    edge1_dir, edge2_dir = np.divide(edges, edges_len, out=np.zeros_like(edges), where=edges_len != 0)
+    edge3 = np.cross(edge1_dir, edge2_dir) * thickness
 
-    matrix = Matrix()
-    matrix[0] = edge1.x, edge2.x, edge3.x, v1.x
-    matrix[1] = edge1.y, edge2.y, edge3.y, v1.y
-    matrix[2] = edge1.z, edge2.z, edge3.z, v1.z
+    matrix = np.identity(4)
+    matrix[:3] = np.column_stack((edge1, edge2, edge3, v1))
 
     # Create projection matrix relative to parent
     parent_inverse = get_parent_inverse(obj)
-    matrix = parent_inverse @ obj.matrix_world @ matrix
+    matrix = np.array(parent_inverse @ obj.matrix_world) @ matrix
 
     try:
-        matrix.invert()
-    except ValueError:
+        matrix = np.linalg.inv(matrix)
+    except np.linalg.LinAlgError:
         logger.warning(
             f"Failed to create shattermap projection matrix for '{obj.name}'. Ensure the object is a flat plane with 4 vertices.")
         return Matrix()
 
-    return matrix
+    return Matrix(matrix.tolist())
 
 
 def get_shattermap_obj(col_obj: bpy.types.Object) -> Optional[bpy.types.Object]:
@@ -876,37 +973,64 @@ def get_window_material(obj: bpy.types.Object) -> Optional[bpy.types.Material]:
             return mat
 
 
-def get_window_geometry_index(drawable_xml: Drawable, window_shader_index: int):
-    """Get index of the geometry using the window material."""
+def get_window_geometry_index_by_shader(drawable_xml: Drawable) -> dict[int, int]:
+    """Get the index of the first geometry using each shader, to look up the geometry of window materials."""
+    geometry_index_by_shader: dict[int, int] = {}
     for dmodel_xml in drawable_xml.drawable_models_high:
         for (index, geometry) in enumerate(dmodel_xml.geometries):
-            if geometry.shader_index != window_shader_index:
-                continue
+            geometry_index_by_shader.setdefault(geometry.shader_index, index)
 
-            return index
+    return geometry_index_by_shader
 
-    return 0
 
+def get_bone_local_transforms(bones: list[Bone]) -> NDArray[np.float32]:
+    """Get the (N, 4, 4) local transforms of ``bones``. Equivalent to ``Matrix.LocRotScale`` for each bone."""
+    translations = np.array([bone.translation for bone in bones], dtype=np.float32).reshape((-1, 3))
+    rotations = np.array([bone.rotation for bone in bones], dtype=np.float32).reshape((-1, 4))
+    scales = np.array([bone.scale for bone in bones], dtype=np.float32).reshape((-1, 3))
 
-def create_bone_transforms_xml(frag_xml: Fragment):
-    def get_bone_transforms(bone: Bone):
-        return Matrix.LocRotScale(bone.translation, bone.rotation, bone.scale)
+    w, x, y, z = rotations.T
+    rot_mats = np.empty((len(bones), 3, 3), dtype=np.float32)
+    rot_mats[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    rot_mats[:, 0, 1] = 2 * (x * y - w * z)
+    rot_mats[:, 0, 2] = 2 * (x * z + w * y)
+    rot_mats[:, 1, 0] = 2 * (x * y + w * z)
+    rot_mats[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    rot_mats[:, 1, 2] = 2 * (y * z - w * x)
+    rot_mats[:, 2, 0] = 2 * (x * z - w * y)
+    rot_mats[:, 2, 1] = 2 * (y * z + w * x)
+    rot_mats[:, 2, 2] = 1 - 2 * (x * x + y * y)
 
-    bones: list[Bone] = frag_xml.drawable.skeleton.bones
+    transforms = np.zeros((len(bones), 4, 4), dtype=np.float32)
+    transforms[:, :3, :3] = rot_mats * scales[:, np.newaxis, :]
+    transforms[:, :3, 3] = translations
+    transforms[:, 3, 3] = 1
 
-    for bone in bones:
+    return transforms
 
-        transforms = get_bone_transforms(bone)
 
-        if bone.parent_index != -1:
-            parent_transforms = frag_xml.bones_transforms[bone.parent_index].value
-            transforms = parent_transforms @ transforms
+def create_bone_transforms_xml(frag_xml: Fragment):
+    bones: list[Bone] = frag_xml.drawable.skeleton.bones
+    if not bones:
+        return
+
+    transforms = get_bone_local_transforms(bones)
 
-        # Reshape to 3x4
-        transforms_reshaped = reshape_mat_3x4(transforms)
+    # Parents always come before their children, so the depth of each bone is known once its parent is reached
+    parent_indices = np.array([bone.parent_index for bone in bones], dtype=np.int64)
+    depths = np.zeros(len(bones), dtype=np.int64)
+    for i, parent_index in enumerate(parent_indices.tolist()):
+        if parent_index != -1:
+            depths[i] = depths[parent_index] + 1
 
-        frag_xml.bones_transforms.append(
-            BoneTransform("Item", transforms_reshaped))
+    # Apply the parent transforms one hierarchy level at a time, all bones of a level in a single matmul
+    for depth in range(1, int(depths.max()) + 1):
+        level_indices = np.flatnonzero(depths == depth)
+        transforms[level_indices] = transforms[parent_indices[level_indices]] @ transforms[level_indices]
+
+    # Reshape to 3x4
+    frag_xml.bones_transforms.extend(
+        BoneTransform("Item", Matrix(transform)) for transform in transforms[:, :3, :].tolist())
 
 
 def calculate_child_drawable_matrices(frag_xml: Fragment):
@@ -918,17 +1042,27 @@ def calculate_child_drawable_matrices(frag_xml: Fragment):
     lod_xml = frag_xml.physics.lod1
     collisions = lod_xml.archetype.bounds.children
 
-    bone_transform_by_tag: dict[str, Matrix] = {
-        b.tag: bone_transforms[i].value for i, b in enumerate(bones)}
-
-    for i, child in enumerate(lod_xml.children):
-        bone_transform = bone_transform_by_tag[child.bone_tag]
-        col = collisions[i]
-
-        bone_inv = bone_transform.to_4x4().inverted()
-
-        matrix = col.composite_transform @ bone_inv.transposed()
-        child.drawable.matrix = reshape_mat_4x3(matrix)
+    children = lod_xml.children
+    if children:
+        bone_index_by_tag: dict[str, int] = {b.tag: i for i, b in enumerate(bones)}
+
+        # Children commonly share bones, so each bone transform is only inverted once
+        child_bone_tags = [child.bone_tag for child in children]
+        bone_tags = list(dict.fromkeys(child_bone_tags))
+        bone_mats = np.zeros((len(bone_tags), 4, 4), dtype=np.float64)
+        bone_mats[:, :3] = [bone_transforms[bone_index_by_tag[tag]].value for tag in bone_tags]
+        bone_mats[:, 3, 3] = 1.0
+        bone_inv_transposed = np.linalg.inv(bone_mats).transpose((0, 2, 1))
+
+        bone_tag_index = {tag: i for i, tag in enumerate(bone_tags)}
+        child_bone_inv_transposed = bone_inv_transposed[[bone_tag_index[tag] for tag in child_bone_tags]]
+        composite_transforms = np.array([collisions[i].composite_transform for i in range(len(children))],
+                                        dtype=np.float64)
+
+        matrices = composite_transforms @ child_bone_inv_transposed
+        # Reshape to 4x3
+        for child, matrix in zip(children, matrices[:, :, :3].tolist()):
+            child.drawable.matrix = Matrix(matrix)
 
     create_child_mat_arrays(lod_xml.children)
 
@@ -954,9 +1088,7 @@ def set_archetype_xml_properties(archetype_props: FragArchetypeProperties, arch_
 
 def set_group_xml_properties(group_props: GroupProperties, group_xml: PhysicsGroup):
     group_xml.glass_window_index = 0
-    group_xml.glass_flags = 0
-    for i in range(len(group_props.flags)):
-        group_xml.glass_flags |= (1 << i) if group_props.flags[i] else 0
+    group_xml.glass_flags = sum(1 << i for i, flag in enumerate(group_props.flags) if flag)
     group_xml.strength = group_props.strength
     group_xml.force_transmission_scale_up = group_props.force_transmission_scale_up
     group_xml.force_transmission_scale_down = group_props.force_transmission_scale_down
@@ -995,13 +1127,13 @@ def set_frag_xml_properties(frag_obj: bpy.types.Object, frag_xml: Fragment):
 
 
 def add_frag_glass_window_xml(
-    frag_obj: bpy.types.Object,
+    glass_window_objs_by_bone: dict[bpy.types.Bone, Tuple[Optional[bpy.types.Object], Optional[bpy.types.Object]]],
     glass_window_bone: bpy.types.Bone,
     materials: list[bpy.types.Material],
     group_xml: PhysicsGroup,
     glass_windows_xml: GlassWindows
 ):
-    mesh_obj, col_obj = get_frag_glass_window_mesh_and_col(frag_obj, glass_window_bone)
+    mesh_obj, col_obj = glass_window_objs_by_bone.get(glass_window_bone, (None, None))
     if mesh_obj is None or col_obj is None:
         logger.warning(f"Glass window '{group_xml.name}' is missing the mesh and/or collision. Skipping...")
         return
@@ -1018,9 +1150,13 @@ def add_frag_glass_window_xml(
 
     glass_windows_xml.append(glass_window_xml)
 
-    # calculate properties from the mesh
-    mesh_obj_eval = get_evaluated_obj(mesh_obj)
-    mesh = mesh_obj_eval.to_mesh()
+    # calculate properties from the mesh, only evaluating it if modifiers or shape keys can change it
+    if obj_mesh_needs_evaluation(mesh_obj):
+        mesh_obj_eval = get_evaluated_obj(mesh_obj)
+        mesh = mesh_obj_eval.to_mesh()
+    else:
+        mesh_obj_eval = None
+        mesh = mesh_obj.data
     mesh_planes = mesh_linked_triangles(mesh)
     if len(mesh_planes) != 2:
         logger.warning(f"Glass window '{group_xml.name}' requires 2 separate planes in mesh.")
@@ -1034,7 +1170,10 @@ def add_frag_glass_window_xml(
             return  # need at least 2 tris in each plane to continue
 
     normals = (plane_a[0].normal, plane_a[1].normal, plane_b[0].normal, plane_b[1].normal)
-    if any(a.cross(b).length_squared > float_info.epsilon for a, b in combinations(normals, 2)):
+    normals_arr = np.array(normals, dtype=np.float64)
+    pair_a, pair_b = np.triu_indices(len(normals), 1)
+    normals_cross = np.cross(normals_arr[pair_a], normals_arr[pair_b])
+    if np.any(np.einsum("ij,ij->i", normals_cross, normals_cross) > float_info.epsilon):
         logger.warning(f"Glass window '{group_xml.name}' mesh planes are not parallel.")
 
     # calculate UV min/max (unused by the game)
@@ -1054,9 +1193,10 @@ def add_frag_glass_window_xml(
 
     # calculate projection matrix
     #   get plane vertices sorted by normalized UV distance to (0, 0)
-    plane_loops = {loop for tri in plane_a for loop in tri.loops}
-    plane_loops = sorted(plane_loops, key=lambda loop: np.linalg.norm((uvs[loop] - uv_min) / (uv_max - uv_min)))
-    plane_verts_and_uvs = [(mesh.loops[loop].vertex_index, uvs[loop]) for loop in plane_loops]
+    plane_loops = np.unique([loop for tri in plane_a for loop in tri.loops])
+    plane_loops_uv_dist = np.linalg.norm((uvs[plane_loops] - uv_min) / (uv_max - uv_min), axis=1)
+    plane_loops = plane_loops[np.argsort(plane_loops_uv_dist, kind="stable")]
+    plane_verts_and_uvs = [(mesh.loops[loop].vertex_index, uvs[loop]) for loop in plane_loops.tolist()]
 
     #   get vertices needed to build the projection (top-left, top-right and bottom-left)
     v0_idx, v0_uv = plane_verts_and_uvs[0]  # vertex at UV min
@@ -1069,7 +1209,7 @@ def add_frag_glass_window_xml(
     v2 = mesh.vertices[v2_idx].co
 
     #   build projection and apply object transform
-    transform = get_parent_inverse(mesh_obj_eval) @ mesh_obj_eval.matrix_world
+    transform = get_parent_inverse(mesh_obj) @ mesh_obj.matrix_world
     transform.invert()
     T = v0 @ transform
     V = (v1 - v0) @ transform
@@ -1087,14 +1227,15 @@ def add_frag_glass_window_xml(
         logger.warning(f"Glass window '{group_xml.name}' mesh is missing a material.")
 
     # calculate bounds offset front/back
-    world_transform = mesh_obj_eval.matrix_world
+    world_transform = mesh_obj.matrix_world
     center_a_world = world_transform @ center_a
     normal_a_world = normals[0].copy()
     normal_a_world.rotate(world_transform)
     bounds_offset_front, bounds_offset_back = calc_frag_glass_window_bounds_offset(col_obj,
                                                                                    center_a_world, normal_a_world)
 
-    mesh_obj_eval.to_mesh_clear()
+    if mesh_obj_eval is not None:
+        mesh_obj_eval.to_mesh_clear()
 
     glass_window_xml.flags |= (shader_index & 0xFF) << 8
     glass_window_xml.projection_matrix = projection
@@ -1106,21 +1247,21 @@ def add_frag_glass_window_xml(
     glass_window_xml.tangent = tangent
 
 
-def get_frag_glass_window_mesh_and_col(
-    frag_obj: bpy.types.Object,
-    glass_window_bone: bpy.types.Bone
-) -> Tuple[Optional[bpy.types.Object], Optional[bpy.types.Object]]:
-    """Finds the mesh and collision object for the glass window bone.
-    Returns tuple (mesh_obj, col_obj)
+def get_frag_glass_window_objs_by_bone(
+    frag_children: FragChildren
+) -> dict[bpy.types.Bone, Tuple[Optional[bpy.types.Object], Optional[bpy.types.Object]]]:
+    """Finds the mesh and collision object for each bone, to be used as glass windows.
+    Returns dict of bone to tuple (mesh_obj, col_obj)
     """
-    mesh_obj = None
-    col_obj = None
-    for obj in frag_obj.children_recursive:
+    objs_by_bone = {}
+    for obj in frag_children.recursive:
         if obj.sollum_type != SollumType.DRAWABLE_MODEL and obj.sollum_type not in BOUND_TYPES:
             continue
 
-        parent_bone = get_child_of_bone(obj)
-        if parent_bone != glass_window_bone:
+        parent_bone = frag_children.get_child_of_bone(obj)
+        mesh_obj, col_obj = objs_by_bone.get(parent_bone, (None, None))
+        if mesh_obj is not None and col_obj is not None:
+            # Already found both, keep the first complete pair
             continue
 
         if obj.sollum_type == SollumType.DRAWABLE_MODEL:
@@ -1128,10 +1269,9 @@ def get_frag_glass_window_mesh_and_col(
         else:
             col_obj = obj
 
-        if mesh_obj is not None and col_obj is not None:
-            break
+        objs_by_bone[parent_bone] = (mesh_obj, col_obj)
 
-    return mesh_obj, col_obj
+    return objs_by_bone
 
 
 def calc_frag_glass_window_bounds_offset(
@@ -1144,14 +1284,8 @@ def calc_frag_glass_window_bounds_offset(
 
     Returns tuple (offset_front, offset_back).
     """
-    from mathutils.geometry import distance_point_to_plane, normal
-
-    def _get_plane(a: Vector, b: Vector, c: Vector, d: Vector):
-        plane_no = normal((a, b, c))
-        plane_co = a
-        return plane_co, plane_no
-
-    bbs = [col_obj.matrix_world @ Vector(corner) for corner in col_obj.bound_box]
+    matrix_world = np.array(col_obj.matrix_world, dtype=np.float64)
+    bbs = np.array(col_obj.bound_box, dtype=np.float64) @ matrix_world[:3, :3].T + matrix_world[:3, 3]
 
     # bound box corners:
     #  [0] = (min.x, min.y, min.z)
@@ -1162,27 +1296,29 @@ def calc_frag_glass_window_bounds_offset(
     #  [5] = (max.x, min.y, max.z)
     #  [6] = (max.x, max.y, max.z)
     #  [7] = (max.x, max.y, min.z)
-    plane_points = (
-        (bbs[4], bbs[3], bbs[0], bbs[7]),  # bottom
-        (bbs[1], bbs[2], bbs[5], bbs[7]),  # top
-        (bbs[2], bbs[1], bbs[0], bbs[3]),  # left
-        (bbs[4], bbs[5], bbs[6], bbs[7]),  # right
-        (bbs[0], bbs[1], bbs[4], bbs[5]),  # front
-        (bbs[2], bbs[3], bbs[6], bbs[7]),  # back
-    )
-    planes = [_get_plane(Vector(a), Vector(b), Vector(c), Vector(d)) for a, b, c, d in plane_points]
-
-    offset_front = 0.0
-    offset_front_dot = 0.0
-    offset_back = 0.0
-    offset_back_dot = 0.0
-    for plane_co, plane_no in planes:
-        d = point_normal.dot(plane_no)
-        if d > offset_front_dot:  # positive dot product is the plane with same normal as the point (in front)
-            offset_front_dot = d
-            offset_front = distance_point_to_plane(point, plane_co, plane_no)
-        elif d < offset_back_dot:  # negative dot product is the plane with opposite normal as the point (behind)
-            offset_back_dot = d
-            offset_back = distance_point_to_plane(point, plane_co, plane_no)
+    plane_points = bbs[[
+        (4, 3, 0),  # bottom
+        (1, 2, 5),  # top
+        (2, 1, 0),  # left
+        (4, 5, 6),  # right
+        (0, 1, 4),  # front
+        (2, 3, 6),  # back
+    ]]
+    a, b, c = plane_points[:, 0], plane_points[:, 1], plane_points[:, 2]
+
+    # Same as mathutils.geometry.normal, degenerate planes get a zero normal
+    planes_no = np.cross(a - b, b - c)
+    planes_no_len = np.linalg.norm(planes_no, axis=1, keepdims=True)
+    planes_no = np.divide(planes_no, planes_no_len, out=np.zeros_like(planes_no), where=planes_no_len != 0.0)
+
+    dots = planes_no @ np.array(point_normal, dtype=np.float64)
+    # Signed distances from point to each plane
+    distances = ((np.array(point, dtype=np.float64) - a) * planes_no).sum(axis=1)
+
+    # The plane most aligned with the point normal is in front, the most opposed one is behind
+    front_index = np.argmax(dots)
+    back_index = np.argmin(dots)
+    offset_front = float(distances[front_index]) if dots[front_index] > 0.0 else 0.0
+    offset_back = float(distances[back_index]) if dots[back_index] < 0.0 else 0.0
 
     return offset_front, offset_back